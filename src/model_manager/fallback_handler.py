@@ -59,7 +59,7 @@ class FallbackHandler:
             # Initialize LLM client first
             logger.info(f"FallbackHandler initializing LLMClient with mcp_session: {self.mcp_session is not None}")
             await self.llm_client.initialize(self.mcp_session)
-            logger.info(f"FallbackHandler initialized successfully, LLMClient clients: {list(self.llm_client.clients.keys())}")
+            logger.info(f"FallbackHandler initialized successfully, LLMClient providers: {self.llm_client.configured_providers}")
             self.initialized = True
             
         except Exception as e:
@@ -201,13 +201,13 @@ class FallbackHandler:
             
             # Call LLM
             logger.info(f"FallbackHandler attempting LLM call with model: {model}")
-            logger.debug(f"LLMClient available clients: {list(self.llm_client.clients.keys())}")
+            logger.debug(f"LLMClient configured providers: {self.llm_client.configured_providers}")
             logger.debug(f"LLMClient initialized: {self.llm_client.initialized}")
             
             # Add debug info directly to prevent loss
             debug_info = {
                 "llm_client_initialized": self.llm_client.initialized,
-                "available_clients": list(self.llm_client.clients.keys()),
+                "available_clients": self.llm_client.configured_providers,
                 "model_requested": model
             }
             
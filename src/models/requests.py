@@ -1,17 +1,204 @@
 """Pydantic models for request validation"""
 
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Optional, Dict, Any, Callable, List
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter, ValidationError, field_validator
 import re
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Injection patterns rejected in requests
+_DANGEROUS_PATTERNS = (
+    r'<script',
+    r'javascript:',
+    r'eval\(',
+    r'exec\(',
+    r'__import__',
+    r'os\.system',
+    r'subprocess\.',
+    r'drop\s+table',
+)
+
+# Literal substring of every pattern above; ASCII requests containing none
+# of these (the common case) skip the regex entirely. Non-ASCII input always
+# goes to the regex: IGNORECASE matches characters such as "ı" or "İ"
+# against "i", which no lowercasing or casefolding of the input reproduces
+_SENTINELS = (
+    '<script',
+    'javascript:',
+    'eval(',
+    'exec(',
+    '__import__',
+    'os.system',
+    'subprocess.',
+    'drop',
+)
+
+# Aho-Corasick automaton over the sentinels: one pass finds any of them
+# regardless of how many there are
+if AHOCORASICK_AVAILABLE:
+    _SENTINEL_AUTOMATON = ahocorasick.Automaton()
+    for _sentinel in _SENTINELS:
+        _SENTINEL_AUTOMATON.add_word(_sentinel, _sentinel)
+    _SENTINEL_AUTOMATON.make_automaton()
+
+
+def _has_sentinel(lowered: str) -> bool:
+    """
+    Check a lowercased ASCII request for any sentinel substring
+    
+    Only valid as a prefilter for ASCII input; callers must send
+    non-ASCII requests to _INJECTION_RE unconditionally.
+    """
+    if AHOCORASICK_AVAILABLE:
+        return next(_SENTINEL_AUTOMATON.iter(lowered), None) is not None
+    return any(sentinel in lowered for sentinel in _SENTINELS)
+
+
+# One alternation with a capture group per pattern, so a single scan finds
+# the first hit and match.lastindex identifies which pattern it was
+_INJECTION_RE = re.compile(
+    "|".join(f"({pattern})" for pattern in _DANGEROUS_PATTERNS),
+    re.IGNORECASE
+)
+
+
+_PERIOD_RE = re.compile(r'(\d+)([smhd])')
+
+# Largest accepted value per period unit
+_PERIOD_MAX = {'s': 3600, 'm': 1440, 'h': 168, 'd': 30}
+
+# Zero-width characters removed from requests before validation
+_ZW_TABLE = dict.fromkeys(map(ord, '\u200b\u200c\u200d\ufeff'), None)
+
+
+def _normalize_request(v: str) -> str:
+    """
+    Remove zero-width characters and surrounding whitespace
+    
+    Args:
+        v: Raw request text
+        
+    Returns:
+        Normalized request
+        
+    Raises:
+        ValueError: If nothing but whitespace remains
+    """
+    # isascii() is a flag check, so ASCII input skips the translate pass
+    if not v.isascii():
+        v = v.translate(_ZW_TABLE)
+    
+    if not v or v.isspace():
+        raise ValueError('Request cannot be empty')
+    
+    # Only allocate a stripped copy when there is something to strip
+    if v[0].isspace() or v[-1].isspace():
+        v = v.strip()
+    return v
+
+
+# Longest accepted request, in characters
+REQUEST_MAX_LENGTH = 10000
+
+# Whitespace stripping for individual string fields; set per field rather
+# than in model_config so it doesn't touch keys in context/options dicts
+_StrippedStr = Annotated[str, StringConstraints(strip_whitespace=True)]
+
+
+def _check_request_text(v: Any, too_long: str) -> Any:
+    """
+    Length and emptiness checks that run before pydantic's own constraints
+    
+    Field constraints run ahead of "after" validators, so these checks must
+    run in "before" mode for their messages to be the ones reported.
+    
+    Args:
+        v: Raw field input
+        too_long: Error message for inputs over REQUEST_MAX_LENGTH
+        
+    Returns:
+        Normalized request, or the input unchanged if it is not text
+    """
+    if isinstance(v, (bytes, bytearray)):
+        # A UTF-8 code point is at most 4 bytes, so anything longer than
+        # this cannot fit and is rejected without decoding it
+        if len(v) > REQUEST_MAX_LENGTH * 4:
+            raise ValueError(too_long)
+        v = v.decode('utf-8')
+    
+    if not isinstance(v, str):
+        return v
+    if len(v) > REQUEST_MAX_LENGTH:
+        raise ValueError(too_long)
+    return _normalize_request(v)
+
+
+# Maximum estimated size of a request context
+CONTEXT_LIMIT = 50000
+
+
+def _exceeds_size(obj: Any, limit: int) -> bool:
+    """
+    Check whether len(str(obj)) of a JSON-like value is larger than limit
+    
+    The length is added up while walking the value instead of building the
+    string: strings count their length plus quotes, other scalars their
+    repr, and containers their brackets and separators. Escape sequences
+    in str() are not counted. The walk stops as soon as the running total
+    passes the limit.
+    
+    Args:
+        obj: Value to measure (dicts, lists, tuples and scalars)
+        limit: Size limit
+        
+    Returns:
+        True if the estimated size exceeds limit
+    """
+    total = 0
+    stack = [obj]
+    seen = set()  # ids of visited containers, guards against cycles
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            total += len(item) + 2
+        elif isinstance(item, bytes):
+            total += len(item) + 3
+        elif isinstance(item, (dict, list, tuple, set)):
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+            # Brackets plus ", " between items
+            total += 2 + 2 * max(len(item) - 1, 0)
+            if isinstance(item, dict):
+                # ": " after each key
+                total += 2 * len(item)
+                stack.extend(item.keys())
+                stack.extend(item.values())
+            else:
+                stack.extend(item)
+        else:
+            total += len(repr(item))
+        
+        if total > limit:
+            return True
+    
+    return False
+
 
 class OrchestrateRequest(BaseModel):
     """Validated orchestration request"""
     
-    request: str = Field(
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    request: _StrippedStr = Field(
         ...,
         min_length=1,
-        max_length=10000,
+        max_length=REQUEST_MAX_LENGTH,
         description="The user's request to orchestrate"
     )
     context: Optional[Dict[str, Any]] = Field(
@@ -23,33 +210,19 @@ class OrchestrateRequest(BaseModel):
         description="User options and preferences"
     )
     
+    @field_validator('request', mode='before')
+    def check_request_text(cls, v):
+        """Reject over-long and empty requests, stripping zero-width characters"""
+        return _check_request_text(v, 'Request too long (max 10000 characters)')
+    
     @field_validator('request')
-    def validate_request(cls, v):
+    def check_injection_patterns(cls, v):
         """Validate and sanitize the request"""
-        # Strip whitespace
-        v = v.strip()
-        
-        # Check for empty request
-        if not v:
-            raise ValueError('Request cannot be empty')
-        
-        # Check for excessive length
-        if len(v) > 10000:
-            raise ValueError('Request too long (max 10000 characters)')
-        
         # Basic sanitization - remove potential injection patterns
-        dangerous_patterns = [
-            r'<script',
-            r'javascript:',
-            r'eval\(',
-            r'exec\(',
-            r'__import__',
-            r'os\.system',
-            r'subprocess\.',
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, v, re.IGNORECASE):
+        if not v.isascii() or _has_sentinel(v.lower()):
+            match = _INJECTION_RE.search(v)
+            if match:
+                pattern = _DANGEROUS_PATTERNS[match.lastindex - 1]
                 raise ValueError(f'Invalid pattern detected in request: {pattern}')
         
         return v
@@ -57,7 +230,7 @@ class OrchestrateRequest(BaseModel):
     @field_validator('context')
     def validate_context(cls, v):
         """Validate context dictionary"""
-        if v and len(str(v)) > 50000:
+        if v and _exceeds_size(v, CONTEXT_LIMIT):
             raise ValueError('Context too large (max 50KB)')
         return v
     
@@ -94,53 +267,79 @@ class OrchestrateRequest(BaseModel):
 class AnalyzeRequest(BaseModel):
     """Validated analysis request"""
     
-    request: str = Field(
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    request: _StrippedStr = Field(
         ...,
         min_length=1,
-        max_length=10000,
+        max_length=REQUEST_MAX_LENGTH,
         description="The request to analyze"
     )
     
-    @field_validator('request')
-    def validate_request(cls, v):
-        """Validate the analysis request"""
-        v = v.strip()
-        if not v:
-            raise ValueError('Request cannot be empty')
-        if len(v) > 10000:
-            raise ValueError('Request too long')
-        return v
+    @field_validator('request', mode='before')
+    def check_request_text(cls, v):
+        """Reject over-long and empty requests, stripping zero-width characters"""
+        return _check_request_text(v, 'Request too long')
 
 
 class MetricsRequest(BaseModel):
     """Validated metrics request"""
     
-    period: str = Field(
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    period: _StrippedStr = Field(
         default="5m",
         pattern="^[0-9]+[smhd]$",
         description="Time period for metrics (e.g., 5m, 1h, 1d)"
     )
     
-    @field_validator('period')
+    @field_validator('period', mode='before')
     def validate_period(cls, v):
         """Validate the time period"""
+        # Runs before the Field pattern so its message is the one reported;
+        # non-string input is left to pydantic's type check
+        if not isinstance(v, str):
+            return v
+        v = v.strip()
+        
         # Extract number and unit
-        import re
-        match = re.match(r'^(\d+)([smhd])$', v)
+        match = _PERIOD_RE.fullmatch(v)
         if not match:
             raise ValueError('Invalid period format (use: 1s, 5m, 1h, 1d)')
         
-        value = int(match.group(1))
-        unit = match.group(2)
+        value, unit = match.groups()
         
         # Validate reasonable ranges
-        max_values = {'s': 3600, 'm': 1440, 'h': 168, 'd': 30}
-        if value > max_values.get(unit, 30):
+        if int(value) > _PERIOD_MAX[unit]:
             raise ValueError(f'Period too long for unit {unit}')
         
         return v
 
 
+# Validators built once at import and reused for every request
+_ADAPTERS: Dict[str, TypeAdapter] = {
+    'orchestrate': TypeAdapter(OrchestrateRequest),
+    'analyze': TypeAdapter(AnalyzeRequest),
+    'metrics': TypeAdapter(MetricsRequest)
+}
+
+
+def _validator_for(adapter: TypeAdapter) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Bind an adapter into a validate-and-dump handler"""
+    validate_python = adapter.validate_python
+    
+    def handler(data: Dict[str, Any]) -> Dict[str, Any]:
+        return validate_python(data).model_dump()
+    
+    return handler
+
+
+# Request type -> handler returning the validated data as a dictionary
+_DISPATCH: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    request_type: _validator_for(adapter) for request_type, adapter in _ADAPTERS.items()
+}
+
+
 def validate_request(request_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate a request based on its type
@@ -155,18 +354,18 @@ def validate_request(request_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
     Raises:
         ValueError: If validation fails
     """
-    validators = {
-        'orchestrate': OrchestrateRequest,
-        'analyze': AnalyzeRequest,
-        'metrics': MetricsRequest
-    }
-    
-    validator_class = validators.get(request_type)
-    if not validator_class:
+    handler = _DISPATCH.get(request_type)
+    if handler is None:
         raise ValueError(f'Unknown request type: {request_type}')
     
     try:
-        validated = validator_class(**data)
-        return validated.model_dump()
-    except Exception as e:
-        raise ValueError(f'Validation failed: {str(e)}')
\ No newline at end of file
+        return handler(data)
+    except ValidationError as e:
+        # Report the first error only; skipping the documentation URL and
+        # input copy avoids formatting the full ValidationError
+        first = e.errors(include_url=False, include_input=False)[0]
+        message = first['msg']
+        if first['loc']:
+            field = '.'.join(str(part) for part in first['loc'])
+            message = f'{field}: {message}'
+        raise ValueError(f'Validation failed: {message}') from None
\ No newline at end of file
@@ -1,14 +1,66 @@
 """Intent classifier for request categorization"""
 
+import hashlib
+import json
 import logging
-from typing import Dict, Any, List
+import sys
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
 from enum import Enum
 
 from ..utils.llm_client import LLMClient
 
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _cache_key(request: str) -> bytes:
+    """32-byte digest of the normalized request, used as the cache key"""
+    normalized = request.strip().lower().encode("utf-8")
+    if BLAKE3_AVAILABLE:
+        return blake3(normalized).digest()
+    return hashlib.blake2b(normalized, digest_size=32).digest()
+
+
+def _parse_json_reply(response: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract a JSON object from an LLM reply
+    
+    The payload is sliced between the first "{" and the last "}", so
+    surrounding whitespace or prose is tolerated.
+    
+    Args:
+        response: Raw LLM reply
+        
+    Returns:
+        Parsed object, or None if the reply holds no valid JSON object
+    """
+    start = response.find("{")
+    end = response.rfind("}")
+    if start == -1 or end < start:
+        return None
+    
+    payload = response[start:end + 1]
+    try:
+        data = orjson.loads(payload) if ORJSON_AVAILABLE else json.loads(payload)
+    except ValueError:
+        # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError
+        return None
+    
+    return data if isinstance(data, dict) else None
+
+
 class Intent(Enum):
     """Supported intent types"""
     READ = "read"
@@ -18,6 +70,18 @@ class Intent(Enum):
     MANAGE = "manage"
 
 
+# Intent value -> member, for O(1) validation of classifier answers. Keys
+# are interned so lookups can match by identity before comparing text
+_INTENT_TABLE: Dict[str, Intent] = {sys.intern(intent.value): intent for intent in Intent}
+
+# Returned (with the error message added) when classification fails;
+# defaults to the most general intent
+_DEFAULT_RESULT: Dict[str, Any] = {
+    "intent": Intent.READ.value,
+    "confidence": 0.0
+}
+
+
 class IntentClassifier:
     """Classifies user requests into intent categories"""
     
@@ -26,6 +90,10 @@ class IntentClassifier:
         self.llm_client = LLMClient(config, mcp_session=mcp_session)
         self.intents = [intent.value for intent in Intent]
         
+        # LRU cache of classification results keyed by request digest
+        self._cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self.cache_size = config.get("classifier", {}).get("cache_size", 4096)
+        
         # Classification prompt template
         self.classification_prompt = """Classify the following request into EXACTLY ONE of these categories:
 {intents}
@@ -56,6 +124,12 @@ Respond with ONLY the category name, nothing else."""
         Returns:
             Dictionary with intent and confidence
         """
+        key = _cache_key(request)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return dict(cached)
+        
         try:
             # Build classification prompt
             prompt = self.classification_prompt.format(
@@ -76,33 +150,58 @@ Respond with ONLY the category name, nothing else."""
                 max_tokens=max_tokens
             )
             
-            # Parse and validate response
-            intent = response.strip().lower()
+            # Parse and validate response; models sometimes answer with a
+            # JSON object instead of the bare category name
+            parsed = _parse_json_reply(response)
+            if parsed and isinstance(parsed.get("intent"), str):
+                answer = parsed["intent"]
+            else:
+                parsed = None
+                answer = response
+            intent = answer.strip().lower()
             
             # Validate intent
-            if intent not in self.intents:
+            member = _INTENT_TABLE.get(intent)
+            if member is None:
                 # Try to match partial or find closest
                 intent = self._fuzzy_match_intent(intent)
+            else:
+                # Return the canonical interned value rather than the parsed
+                # copy, so downstream comparisons short-circuit on identity
+                intent = member.value
             
-            # Calculate confidence based on response clarity
-            confidence = self._calculate_confidence(response, intent)
+            # Use the model's own confidence when it reports one in [0, 1],
+            # otherwise calculate it from response clarity
+            reported = parsed.get("confidence") if parsed else None
+            if (
+                isinstance(reported, (int, float))
+                and not isinstance(reported, bool)
+                and 0.0 <= reported <= 1.0
+            ):
+                confidence = float(reported)
+            else:
+                confidence = self._calculate_confidence(answer, intent)
             
             logger.info(f"Classified request as '{intent}' with confidence {confidence}")
             
-            return {
+            result = {
                 "intent": intent,
                 "confidence": confidence,
                 "raw_response": response
             }
+            if parsed and "reasoning" in parsed:
+                result["reasoning"] = parsed["reasoning"]
+            
+            # Only successful classifications are cached
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            
+            return dict(result)
             
         except Exception as e:
             logger.error(f"Intent classification failed: {e}")
-            # Default to most general intent
-            return {
-                "intent": Intent.READ.value,
-                "confidence": 0.0,
-                "error": str(e)
-            }
+            return {**_DEFAULT_RESULT, "error": str(e)}
     
     def _fuzzy_match_intent(self, response: str) -> str:
         """
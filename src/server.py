@@ -308,7 +308,7 @@ class DynamicOrchestratorServer:
                 "model": model,
                 "response": response,
                 "llm_initialized": llm_client.initialized,
-                "available_clients": list(llm_client.clients.keys())
+                "available_clients": llm_client.configured_providers
             }
             
         except Exception as e:
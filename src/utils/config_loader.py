@@ -1,53 +1,89 @@
 """Configuration loader"""
 
 import os
+import re
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 import yaml
 import logging
 
+from . import envs
+
 logger = logging.getLogger(__name__)
 
+# Matches ${VAR} placeholders anywhere inside a string value
+_ENV_RE = re.compile(r"\$\{([^}]+)\}")
+
+
+def _env_lookup(match: re.Match) -> str:
+    """Resolve a ${VAR} match, leaving it untouched if VAR is unset"""
+    return os.environ.get(match.group(1), match.group(0))
+
+
+@lru_cache(maxsize=512)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dotted config key into its path segments"""
+    return tuple(key.split("."))
+
 
 class ConfigLoader:
     """Load and manage configuration"""
     
     def __init__(self, config_dir: str = "config"):
         self.config_dir = Path(config_dir)
-        self.config_cache: Dict[str, Any] = {}
+        # filename -> (st_mtime_ns, st_size, parsed config)
+        self.config_cache: Dict[str, Tuple[int, int, Any]] = {}
+        # filename -> resolved path, so the Path join happens once per file
+        self._path_cache: Dict[str, Path] = {}
     
-    def load_yaml(self, filename: str) -> Dict[str, Any]:
+    def load_yaml(self, filename: str, freeze_result: bool = False) -> Mapping[str, Any]:
         """
         Load a YAML configuration file
         
+        The parsed result is cached and reused until the file's mtime or
+        size changes, so edits are picked up by long-running processes.
+        
         Args:
             filename: Name of the YAML file
+            freeze_result: Return a read-only view of the cached config
             
         Returns:
             Configuration dictionary
         """
-        if filename in self.config_cache:
-            return self.config_cache[filename]
+        filename = sys.intern(filename)
+        file_path = self._path_cache.get(filename)
+        if file_path is None:
+            file_path = self._path_cache[filename] = self.config_dir / filename
         
-        file_path = self.config_dir / filename
-        
-        if not file_path.exists():
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
             logger.warning(f"Configuration file not found: {file_path}")
+            self.config_cache.pop(filename, None)
             return {}
         
-        try:
-            with open(file_path, 'r') as f:
-                config = yaml.safe_load(f)
+        cached = self.config_cache.get(filename)
+        if cached is not None and (cached[0], cached[1]) == (st.st_mtime_ns, st.st_size):
+            config = cached[2]
+        else:
+            try:
+                with open(file_path, 'r') as f:
+                    config = yaml.safe_load(f)
+                    
+                # Replace environment variables
+                config = self._replace_env_vars(config)
                 
-            # Replace environment variables
-            config = self._replace_env_vars(config)
-            
-            self.config_cache[filename] = config
-            return config
-            
-        except Exception as e:
-            logger.error(f"Failed to load configuration from {file_path}: {e}")
-            return {}
+                self.config_cache[filename] = (st.st_mtime_ns, st.st_size, config)
+            except Exception as e:
+                logger.error(f"Failed to load configuration from {file_path}: {e}")
+                return {}
+        
+        if freeze_result and isinstance(config, dict):
+            return MappingProxyType(config)
+        return config
     
     def load_all(self) -> Dict[str, Any]:
         """
@@ -69,25 +105,49 @@ class ConfigLoader:
         
         return config
     
-    def _replace_env_vars(self, config: Any) -> Any:
+    def _replace_env_vars(self, config: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
         """
-        Recursively replace environment variable references
+        Replace environment variable references
+        
+        Walks the tree iteratively and substitutes strings in place, so
+        containers without placeholders are never rebuilt. Containers shared
+        between sections (YAML anchors) are visited only once.
         
         Args:
-            config: Configuration data
+            config: Configuration data (mutated in place)
+            memo: id() -> container map of nodes already processed
             
         Returns:
             Configuration with env vars replaced
         """
-        if isinstance(config, dict):
-            return {k: self._replace_env_vars(v) for k, v in config.items()}
-        elif isinstance(config, list):
-            return [self._replace_env_vars(item) for item in config]
-        elif isinstance(config, str) and config.startswith("${") and config.endswith("}"):
-            env_var = config[2:-1]
-            return os.environ.get(env_var, config)
-        else:
+        if isinstance(config, str):
+            if "${" not in config:
+                return config
+            return _ENV_RE.sub(_env_lookup, config)
+        
+        if not isinstance(config, (dict, list)):
             return config
+        
+        if memo is None:
+            memo = {}
+        if id(config) in memo:
+            return config
+        
+        memo[id(config)] = config
+        stack = [config]
+        while stack:
+            node = stack.pop()
+            items = node.items() if isinstance(node, dict) else enumerate(node)
+            for key, value in items:
+                if isinstance(value, str):
+                    if "${" in value:
+                        node[key] = _ENV_RE.sub(_env_lookup, value)
+                elif isinstance(value, (dict, list)) and id(value) not in memo:
+                    # Keep a reference so the id stays valid for the walk
+                    memo[id(value)] = value
+                    stack.append(value)
+        
+        return config
     
     def _load_env_vars(self) -> Dict[str, str]:
         """
@@ -100,17 +160,18 @@ class ConfigLoader:
         
         # API Keys
         for key in ["OPENAI_API_KEY", "GOOGLE_API_KEY", "ANTHROPIC_API_KEY", "GITHUB_TOKEN"]:
-            if key in os.environ:
-                env_vars[key] = os.environ[key]
+            value = getattr(envs, key)
+            if value is not None:
+                env_vars[key] = value
         
         # Service configuration
-        env_vars["LOG_LEVEL"] = os.environ.get("LOG_LEVEL", "INFO")
-        env_vars["MCP_PORT"] = os.environ.get("MCP_PORT", "8080")
-        env_vars["CACHE_TTL"] = os.environ.get("CACHE_TTL", "3600")
+        env_vars["LOG_LEVEL"] = envs.LOG_LEVEL
+        env_vars["MCP_PORT"] = envs.MCP_PORT
+        env_vars["CACHE_TTL"] = envs.CACHE_TTL
         
         # Redis configuration
-        env_vars["REDIS_HOST"] = os.environ.get("REDIS_HOST", "localhost")
-        env_vars["REDIS_PORT"] = os.environ.get("REDIS_PORT", "6379")
+        env_vars["REDIS_HOST"] = envs.REDIS_HOST
+        env_vars["REDIS_PORT"] = envs.REDIS_PORT
         
         return env_vars
     
@@ -118,6 +179,11 @@ class ConfigLoader:
         """
         Get a configuration value
         
+        Keys are resolved against the merged configuration from load_all(),
+        e.g. "models.classifier.default" or "env.LOG_LEVEL". load_all() only
+        re-parses files whose mtime or size changed, so edits are visible
+        on the next call.
+        
         Args:
             key: Configuration key (supports dot notation)
             default: Default value if key not found
@@ -125,10 +191,9 @@ class ConfigLoader:
         Returns:
             Configuration value
         """
-        keys = key.split(".")
-        value = self.config_cache
+        value = self.load_all()
         
-        for k in keys:
+        for k in _split_key(key):
             if isinstance(value, dict):
                 value = value.get(k)
                 if value is None:
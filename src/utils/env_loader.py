@@ -1,13 +1,23 @@
 """Secure environment variable loader for API keys"""
 
-import os
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from pathlib import Path
 from dotenv import load_dotenv
 
+from . import envs
+from .logger import set_log_level
+
 logger = logging.getLogger(__name__)
 
+# Provider name -> environment variable holding its API key
+_PROVIDER_ENV: Dict[str, str] = {
+    "openai": "OPENAI_API_KEY",
+    "google": "GOOGLE_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY"
+}
+
 
 class EnvLoader:
     """Securely load and manage API keys from environment"""
@@ -16,7 +26,14 @@ class EnvLoader:
         # Load from .env file if exists
         env_path = Path(__file__).parent.parent.parent / '.env'
         if env_path.exists():
+            log_level = envs.LOG_LEVEL
             load_dotenv(env_path)
+            envs.clear_cache()
+            EnvLoader.get_redis_config.cache_clear()
+            EnvLoader.get_monitoring_config.cache_clear()
+            # Logging is configured at import, before any .env is loaded
+            if envs.LOG_LEVEL != log_level:
+                set_log_level(envs.LOG_LEVEL)
             logger.info("Loaded environment variables from .env file")
     
     @staticmethod
@@ -30,18 +47,12 @@ class EnvLoader:
         Returns:
             API key or None if not found
         """
-        key_mapping = {
-            "openai": "OPENAI_API_KEY",
-            "google": "GOOGLE_API_KEY", 
-            "anthropic": "ANTHROPIC_API_KEY"
-        }
-        
-        env_var = key_mapping.get(provider.lower())
+        env_var = _PROVIDER_ENV.get(provider.lower())
         if not env_var:
             logger.warning(f"Unknown provider: {provider}")
             return None
         
-        api_key = os.environ.get(env_var)
+        api_key = getattr(envs, env_var)
         
         if not api_key:
             logger.warning(f"API key not found for {provider} (env var: {env_var})")
@@ -65,7 +76,7 @@ class EnvLoader:
         if not api_key or len(api_key) < 12:
             return "***"
         
-        return f"{api_key[:4]}...{api_key[-4:]}"
+        return "".join((api_key[:4], "...", api_key[-4:]))
     
     @staticmethod
     def validate_api_keys() -> Dict[str, bool]:
@@ -75,10 +86,9 @@ class EnvLoader:
         Returns:
             Dictionary of provider -> availability
         """
-        providers = ["openai", "google", "anthropic"]
         status = {}
         
-        for provider in providers:
+        for provider in _PROVIDER_ENV:
             key = EnvLoader.get_api_key(provider)
             status[provider] = bool(key)
             
@@ -91,18 +101,20 @@ class EnvLoader:
         return status
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_redis_config() -> Dict[str, Any]:
-        """Get Redis configuration from environment"""
+        """Get Redis configuration from environment (cached, do not mutate)"""
         return {
-            "url": os.environ.get("REDIS_URL", "redis://localhost:6379"),
-            "password": os.environ.get("REDIS_PASSWORD"),
-            "ssl": os.environ.get("REDIS_SSL", "false").lower() == "true"
+            "url": envs.REDIS_URL,
+            "password": envs.REDIS_PASSWORD,
+            "ssl": envs.REDIS_SSL
         }
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_monitoring_config() -> Dict[str, Any]:
-        """Get monitoring configuration from environment"""
+        """Get monitoring configuration from environment (cached, do not mutate)"""
         return {
-            "prometheus_port": int(os.environ.get("PROMETHEUS_PORT", "9090")),
-            "metrics_enabled": os.environ.get("METRICS_ENABLED", "true").lower() == "true"
+            "prometheus_port": envs.PROMETHEUS_PORT,
+            "metrics_enabled": envs.METRICS_ENABLED
         }
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""Environment variables, resolved once on first access
+
+Usage:
+    from . import envs
+    envs.REDIS_URL
+"""
+
+import os
+from typing import Any, Callable, Dict, List
+
+
+environment_variables: Dict[str, Callable[[], Any]] = {
+    # API Keys
+    "OPENAI_API_KEY": lambda: os.environ.get("OPENAI_API_KEY"),
+    "GOOGLE_API_KEY": lambda: os.environ.get("GOOGLE_API_KEY"),
+    "ANTHROPIC_API_KEY": lambda: os.environ.get("ANTHROPIC_API_KEY"),
+    "GITHUB_TOKEN": lambda: os.environ.get("GITHUB_TOKEN"),
+
+    # Service configuration
+    "LOG_LEVEL": lambda: os.environ.get("LOG_LEVEL", "INFO"),
+    "MCP_PORT": lambda: os.environ.get("MCP_PORT", "8080"),
+    "CACHE_TTL": lambda: os.environ.get("CACHE_TTL", "3600"),
+
+    # Logging configuration
+    "FAST_LOGS": lambda: bool(os.environ.get("FAST_LOGS")),
+    "DEBUG_LOG_PATH": lambda: os.environ.get("DEBUG_LOG_PATH"),
+
+    # Redis configuration
+    "REDIS_HOST": lambda: os.environ.get("REDIS_HOST", "localhost"),
+    "REDIS_PORT": lambda: os.environ.get("REDIS_PORT", "6379"),
+    "REDIS_URL": lambda: os.environ.get("REDIS_URL", "redis://localhost:6379"),
+    "REDIS_PASSWORD": lambda: os.environ.get("REDIS_PASSWORD"),
+    "REDIS_SSL": lambda: os.environ.get("REDIS_SSL", "false").lower() == "true",
+
+    # Monitoring configuration
+    "PROMETHEUS_PORT": lambda: int(os.environ.get("PROMETHEUS_PORT", "9090")),
+    "METRICS_ENABLED": lambda: os.environ.get("METRICS_ENABLED", "true").lower() == "true",
+}
+
+_cache: Dict[str, Any] = {}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve an environment variable on first access and cache it"""
+    try:
+        return _cache[name]
+    except KeyError:
+        pass
+
+    if name in environment_variables:
+        value = _cache[name] = environment_variables[name]()
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return list(environment_variables.keys())
+
+
+def clear_cache() -> None:
+    """Forget resolved values, e.g. after loading a .env file"""
+    _cache.clear()
@@ -1,6 +1,8 @@
 """Unified LLM client for multiple providers"""
 
 import logging
+import re
+from functools import lru_cache
 from typing import Any, Dict, Optional, List
 from enum import Enum
 
@@ -18,6 +20,76 @@ class LLMProvider(Enum):
     ANTHROPIC = "anthropic"
 
 
+# Model-name keywords identifying each provider, matched in a single scan
+_MODEL_RE = re.compile(r"(gpt|o3|o4|turbo|gemini|palm|bard|claude|anthropic)")
+
+_TOKEN_PROVIDER = {
+    "gpt": LLMProvider.OPENAI,
+    "o3": LLMProvider.OPENAI,
+    "o4": LLMProvider.OPENAI,
+    "turbo": LLMProvider.OPENAI,
+    "gemini": LLMProvider.GOOGLE,
+    "palm": LLMProvider.GOOGLE,
+    "bard": LLMProvider.GOOGLE,
+    "claude": LLMProvider.ANTHROPIC,
+    "anthropic": LLMProvider.ANTHROPIC,
+}
+
+
+# Default model per provider when the requested model can't be routed
+_FALLBACK_MODELS = {
+    LLMProvider.OPENAI: "gpt-3.5-turbo",
+    LLMProvider.GOOGLE: "gemini-2.0-flash",
+    LLMProvider.ANTHROPIC: "claude-3-haiku-20240307",
+}
+
+
+def estimate_tokens(text: str, _len=len) -> int:
+    """Rough token estimate: 1 token ≈ 4 characters"""
+    return _len(text) >> 2
+
+
+def _create_openai_client(api_key: str) -> Any:
+    import openai
+    return openai.AsyncOpenAI(api_key=api_key)
+
+
+def _create_google_client(api_key: str) -> Any:
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    return genai
+
+
+def _create_anthropic_client(api_key: str) -> Any:
+    import anthropic
+    return anthropic.AsyncAnthropic(api_key=api_key)
+
+
+# Provider -> (display name, SDK client factory)
+_SDK_FACTORIES = {
+    LLMProvider.OPENAI: ("OpenAI", _create_openai_client),
+    LLMProvider.GOOGLE: ("Google Gemini", _create_google_client),
+    LLMProvider.ANTHROPIC: ("Anthropic", _create_anthropic_client),
+}
+
+
+@lru_cache(maxsize=256)
+def _provider_for_model(model_lower: str) -> Optional[LLMProvider]:
+    """Map a lower-cased model name to its provider"""
+    match = _MODEL_RE.search(model_lower)
+    return _TOKEN_PROVIDER[match.group(1)] if match else None
+
+
+@lru_cache(maxsize=64)
+def _resolve_google_model(model: str, model_lower: str) -> str:
+    """Map model names to correct Gemini model names, given the lower-cased name"""
+    if "flash" in model_lower:
+        return "gemini-2.0-flash-exp"  # Correct experimental model name
+    elif "pro" in model_lower:
+        return "gemini-1.5-pro"
+    return model
+
+
 class LLMClient:
     """Unified client for multiple LLM providers"""
     
@@ -27,6 +99,23 @@ class LLMClient:
         self.initialized = False
         self.mcp_session = mcp_session
         self.claude_code_client = None
+        # Gemini model name -> GenerativeModel, built once per name
+        self._gemini_models: Dict[str, Any] = {}
+        # Providers with an API key; SDK clients are built lazily
+        self._api_keys: Dict[LLMProvider, str] = {}
+        # Provider -> completion method
+        self._dispatch = {
+            LLMProvider.OPENAI: self._complete_openai,
+            LLMProvider.GOOGLE: self._complete_google,
+            LLMProvider.ANTHROPIC: self._complete_anthropic,
+        }
+    
+    @property
+    def configured_providers(self) -> List[LLMProvider]:
+        """Providers this client can route to, whether or not their SDK is imported yet"""
+        providers = [LLMProvider.CLAUDE_CODE] if LLMProvider.CLAUDE_CODE in self.clients else []
+        providers.extend(self._api_keys)
+        return providers
     
     async def initialize(self, mcp_session=None):
         """Initialize LLM clients based on available API keys"""
@@ -55,50 +144,21 @@ class LLMClient:
             except Exception as e:
                 logger.error(f"Failed to initialize Claude Code client: {e}", exc_info=True)
         
-        # Load environment variables securely
+        # Load environment variables securely. Provider SDKs are heavy to
+        # import, so only record which keys exist; clients are created on
+        # first use in _get_client.
         env_loader = EnvLoader()
         
-        # Check for OpenAI
-        openai_key = env_loader.get_api_key("openai")
-        if openai_key:
-            try:
-                import openai
-                self.clients[LLMProvider.OPENAI] = openai.AsyncOpenAI(
-                    api_key=openai_key
-                )
-                masked_key = env_loader.mask_api_key(openai_key)
-                logger.info(f"OpenAI client initialized with key: {masked_key}")
-            except ImportError:
-                logger.warning("OpenAI library not installed")
-        
-        # Check for Google
-        google_key = env_loader.get_api_key("google")
-        if google_key:
-            try:
-                import google.generativeai as genai
-                genai.configure(api_key=google_key)
-                self.clients[LLMProvider.GOOGLE] = genai
-                masked_key = env_loader.mask_api_key(google_key)
-                logger.info(f"Google Gemini client initialized with key: {masked_key}")
-            except ImportError:
-                logger.warning("Google Generative AI library not installed")
-        
-        # Check for Anthropic
-        anthropic_key = env_loader.get_api_key("anthropic")
-        if anthropic_key:
-            try:
-                import anthropic
-                self.clients[LLMProvider.ANTHROPIC] = anthropic.AsyncAnthropic(
-                    api_key=anthropic_key
-                )
-                masked_key = env_loader.mask_api_key(anthropic_key)
-                logger.info(f"Anthropic client initialized with key: {masked_key}")
-            except ImportError:
-                logger.warning("Anthropic library not installed")
+        for provider in _SDK_FACTORIES:
+            api_key = env_loader.get_api_key(provider.value)
+            if api_key:
+                self._api_keys[provider] = api_key
+                masked_key = env_loader.mask_api_key(api_key)
+                logger.info(f"{_SDK_FACTORIES[provider][0]} API key configured: {masked_key}")
         
         self.initialized = True
         
-        if not self.clients:
+        if not self.configured_providers:
             logger.warning("No LLM providers initialized. Please set API keys.")
     
     async def complete(
@@ -123,12 +183,12 @@ class LLMClient:
             Generated text
         """
         logger.info(f"LLMClient.complete called with model={model}, initialized={self.initialized}")
-        logger.debug(f"Available clients: {list(self.clients.keys())}")
+        logger.debug(f"Configured providers: {self.configured_providers}")
         logger.debug(f"Claude Code client available: {self.claude_code_client and self.claude_code_client.is_available()}")
         
         # Check if we have any clients at all
-        if not self.initialized or not self.clients:
-            error_msg = f"LLMClient not properly initialized. initialized={self.initialized}, clients={list(self.clients.keys())}"
+        if not self.initialized or not self.configured_providers:
+            error_msg = f"LLMClient not properly initialized. initialized={self.initialized}, providers={self.configured_providers}"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
         
@@ -149,7 +209,8 @@ class LLMClient:
                 logger.error(f"Claude Code completion failed, falling back: {e}", exc_info=True)
         
         # Fall back to external APIs
-        provider = self._get_provider_from_model(model)
+        model_l = model.lower()
+        provider = self._get_provider_from_model(model_l)
         
         if not provider:
             logger.warning(f"Could not determine provider for model '{model}'. Using fallback.")
@@ -158,46 +219,53 @@ class LLMClient:
         logger.info(f"Using provider: {provider} for model: {model}")
         
         try:
-            if provider == LLMProvider.OPENAI:
-                return await self._complete_openai(prompt, model, temperature, max_tokens, **kwargs)
-            elif provider == LLMProvider.GOOGLE:
-                return await self._complete_google(prompt, model, temperature, max_tokens, **kwargs)
-            elif provider == LLMProvider.ANTHROPIC:
-                return await self._complete_anthropic(prompt, model, temperature, max_tokens, **kwargs)
-            else:
+            complete_fn = self._dispatch.get(provider)
+            if complete_fn is None:
                 error_msg = f"Unknown provider {provider} for model {model}"
                 logger.error(error_msg)
                 raise ValueError(error_msg)
+            return await complete_fn(prompt, model, model_l, temperature, max_tokens, **kwargs)
         except Exception as provider_error:
             logger.error(f"Provider {provider} failed for model {model}: {provider_error}")
             raise
     
-    def _get_provider_from_model(self, model: str) -> Optional[LLMProvider]:
-        """Determine provider from model name"""
-        model_lower = model.lower()
+    def _get_client(self, provider: LLMProvider) -> Any:
+        """Get the SDK client for a provider, importing the SDK on first use"""
+        client = self.clients.get(provider)
+        if client is not None:
+            return client
         
-        if any(x in model_lower for x in ["gpt", "o3", "o4", "turbo"]):
-            return LLMProvider.OPENAI
-        elif any(x in model_lower for x in ["gemini", "palm", "bard"]):
-            return LLMProvider.GOOGLE
-        elif any(x in model_lower for x in ["claude", "anthropic"]):
-            return LLMProvider.ANTHROPIC
+        name, factory = _SDK_FACTORIES[provider]
+        api_key = self._api_keys.get(provider)
+        if not api_key:
+            raise ValueError(f"{name} client not initialized")
+        
+        try:
+            client = factory(api_key)
+        except ImportError:
+            logger.warning(f"{name} library not installed")
+            del self._api_keys[provider]
+            raise ValueError(f"{name} client not initialized")
         
-        return None
+        self.clients[provider] = client
+        logger.info(f"{name} client initialized")
+        return client
+    
+    def _get_provider_from_model(self, model_lower: str) -> Optional[LLMProvider]:
+        """Determine provider from a lower-cased model name"""
+        return _provider_for_model(model_lower)
     
     async def _complete_openai(
         self,
         prompt: str,
         model: str,
+        model_lower: str,
         temperature: float,
         max_tokens: int,
         **kwargs
     ) -> str:
         """OpenAI completion"""
-        if LLMProvider.OPENAI not in self.clients:
-            raise ValueError("OpenAI client not initialized")
-        
-        client = self.clients[LLMProvider.OPENAI]
+        client = self._get_client(LLMProvider.OPENAI)
         
         try:
             response = await client.chat.completions.create(
@@ -216,58 +284,50 @@ class LLMClient:
         self,
         prompt: str,
         model: str,
+        model_lower: str,
         temperature: float,
         max_tokens: int,
         **kwargs
     ) -> str:
         """Google Gemini completion"""
-        if LLMProvider.GOOGLE not in self.clients:
-            raise ValueError("Google client not initialized")
-        
-        genai = self.clients[LLMProvider.GOOGLE]
+        genai = self._get_client(LLMProvider.GOOGLE)
         
         try:
-            # Map model names to correct Gemini model names
-            if "flash" in model.lower():
-                model_name = "gemini-2.0-flash-exp"  # Correct experimental model name
-            elif "pro" in model.lower():
-                model_name = "gemini-1.5-pro"
-            else:
-                model_name = model
+            model_name = _resolve_google_model(model, model_lower)
             
-            model_instance = genai.GenerativeModel(model_name)
+            model_instance = self._get_gemini_model(genai, model_name)
             
-            # Use asyncio to run the synchronous method
-            import asyncio
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: model_instance.generate_content(
-                    prompt,
-                    generation_config={
-                        "temperature": temperature,
-                        "max_output_tokens": max_tokens,
-                    }
-                )
+            response = await model_instance.generate_content_async(
+                prompt,
+                generation_config={
+                    "temperature": temperature,
+                    "max_output_tokens": max_tokens,
+                }
             )
             return response.text
         except Exception as e:
             logger.error(f"Google completion failed: {e}")
             raise
     
+    def _get_gemini_model(self, genai: Any, model_name: str) -> Any:
+        """Get a cached GenerativeModel instance for a model name"""
+        model_instance = self._gemini_models.get(model_name)
+        if model_instance is None:
+            model_instance = genai.GenerativeModel(model_name)
+            self._gemini_models[model_name] = model_instance
+        return model_instance
+    
     async def _complete_anthropic(
         self,
         prompt: str,
         model: str,
+        model_lower: str,
         temperature: float,
         max_tokens: int,
         **kwargs
     ) -> str:
         """Anthropic Claude completion"""
-        if LLMProvider.ANTHROPIC not in self.clients:
-            raise ValueError("Anthropic client not initialized")
-        
-        client = self.clients[LLMProvider.ANTHROPIC]
+        client = self._get_client(LLMProvider.ANTHROPIC)
         
         try:
             response = await client.messages.create(
@@ -291,20 +351,14 @@ class LLMClient:
     ) -> str:
         """Fallback to any available provider"""
         # Try each provider in order
-        for provider, client in self.clients.items():
+        for provider in list(self._api_keys):
+            complete_fn = self._dispatch[provider]
+            # Fallback model names are already lower-case
+            model = _FALLBACK_MODELS[provider]
             try:
-                if provider == LLMProvider.OPENAI:
-                    return await self._complete_openai(
-                        prompt, "gpt-3.5-turbo", temperature, max_tokens, **kwargs
-                    )
-                elif provider == LLMProvider.GOOGLE:
-                    return await self._complete_google(
-                        prompt, "gemini-2.0-flash", temperature, max_tokens, **kwargs
-                    )
-                elif provider == LLMProvider.ANTHROPIC:
-                    return await self._complete_anthropic(
-                        prompt, "claude-3-haiku-20240307", temperature, max_tokens, **kwargs
-                    )
+                return await complete_fn(
+                    prompt, model, model, temperature, max_tokens, **kwargs
+                )
             except Exception as e:
                 logger.warning(f"Fallback to {provider.value} failed: {e}")
                 continue
@@ -321,27 +375,26 @@ class LLMClient:
         Returns:
             Estimated token count
         """
-        # Rough estimate: 1 token ≈ 4 characters
-        return len(text) // 4
+        return estimate_tokens(text)
     
     def get_available_models(self) -> List[str]:
         """Get list of available models based on initialized clients"""
         models = []
         
-        if LLMProvider.OPENAI in self.clients:
+        if LLMProvider.OPENAI in self._api_keys:
             models.extend([
                 "gpt-4o", "gpt-4o-mini", "gpt-4-turbo",
                 "gpt-3.5-turbo", "o3", "o3-mini"
             ])
         
-        if LLMProvider.GOOGLE in self.clients:
+        if LLMProvider.GOOGLE in self._api_keys:
             models.extend([
                 "gemini-2.0-flash", "gemini-2.0-flash-lite",
                 "gemini-2.5-flash", "gemini-2.5-pro",
                 "gemini-pro"
             ])
         
-        if LLMProvider.ANTHROPIC in self.clients:
+        if LLMProvider.ANTHROPIC in self._api_keys:
             models.extend([
                 "claude-3-opus-20240229",
                 "claude-3-sonnet-20240229",
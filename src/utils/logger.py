@@ -1,71 +1,353 @@
 """Logging configuration"""
 
+import atexit
+import functools
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 import structlog
 
+from . import envs
 
-def setup_logger(name: Optional[str] = None) -> logging.Logger:
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _orjson_dumps(value, default=None, **kwargs) -> str:
     """
-    Setup structured logging
+    JSONRenderer serializer backed by orjson
+    
+    Falls back to json.dumps for values orjson rejects without consulting
+    default, such as integers wider than 64 bits.
+    """
+    try:
+        return orjson.dumps(value, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(value, default=default, **kwargs)
+
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last timestamp
+_last_second: Tuple[int, str] = (-1, "")
+
+
+def _fast_iso_timestamper(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drop-in for TimeStamper(fmt="iso") that formats each UTC second once
+    
+    Records within the same second reuse the cached prefix and only
+    format the microseconds.
+    """
+    global _last_second
+    
+    now = time.time()
+    sec = int(now)
+    cached_sec, prefix = _last_second
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _last_second = (sec, prefix)
+    
+    event_dict["timestamp"] = f"{prefix}.{int((now - sec) * 1e6):06d}Z"
+    return event_dict
+
+
+# stderr's TTY status doesn't change at runtime, so check it once at import
+_IS_TTY = sys.stderr.isatty()
+
+# FAST_LOGS=1 trades the colorized console output for plain key=value
+# lines, e.g. for large `pytest -s` runs attached to a terminal
+if envs.FAST_LOGS:
+    _RENDERER = structlog.processors.KeyValueRenderer(sort_keys=False)
+elif _IS_TTY:
+    _RENDERER = structlog.dev.ConsoleRenderer()
+elif ORJSON_AVAILABLE:
+    _RENDERER = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+else:
+    _RENDERER = structlog.processors.JSONRenderer()
+
+_STACK_INFO_RENDERER = structlog.processors.StackInfoRenderer()
+
+# Level filtering happens in the wrapper class (make_filtering_bound_logger),
+# before an event dict is built, so there is no filter_by_level processor
+_PROCESSORS = (
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    _fast_iso_timestamper,
+    _STACK_INFO_RENDERER,
+    structlog.processors.format_exc_info,
+    # Kept on the orjson path too: orjson doesn't serialize bytes, so
+    # without decoding they would be rendered as their repr
+    structlog.processors.UnicodeDecoder(),
+    _RENDERER,
+)
+
+
+def _processors_for_level(log_level: int) -> List[Any]:
+    """
+    Processor chain for a log level
+    
+    stack_info rendering is a debugging aid, so it is only kept at DEBUG.
+    format_exc_info always stays so exc_info=True tracebacks are rendered.
+    """
+    if log_level <= logging.DEBUG:
+        return list(_PROCESSORS)
+    return [p for p in _PROCESSORS if p is not _STACK_INFO_RENDERER]
+
+
+# Resolved once at import; set_log_level() changes it at runtime
+_LOG_LEVEL = getattr(logging, envs.LOG_LEVEL.upper(), logging.INFO)
+
+_configured = False
+_configure_lock = threading.Lock()
+# Loggers handed out by setup_logger; set_log_level() resets their cached
+# bound loggers so they pick up the new level
+_loggers: "weakref.WeakSet[Any]" = weakref.WeakSet()
+# Drains queued records to the debug log file off the caller's thread
+_file_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    Handler that batches writes to a buffered binary stream
+    
+    The buffer is flushed every flush_interval seconds, immediately for
+    records at ERROR or above, and on close.
+    """
+    
+    def __init__(self, stream: BinaryIO, flush_interval: float = 30.0):
+        super().__init__(stream)
+        self.flush_interval = flush_interval
+        self._closed = False
+        # One long-lived flusher thread per handler, woken early by close()
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="log-flusher", daemon=True
+        )
+        self._flusher.start()
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg.encode('utf-8'))
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_loop(self) -> None:
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.acquire()
+            try:
+                if self._closed:
+                    return
+                self.flush()
+            finally:
+                self.release()
+    
+    def close(self) -> None:
+        self._stop_flushing.set()
+        self.acquire()
+        try:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self.flush()
+            finally:
+                stream, self.stream = self.stream, None
+                stream.close()
+        finally:
+            self.release()
+        if threading.current_thread() is not self._flusher:
+            self._flusher.join(timeout=1.0)
+        logging.Handler.close(self)
+
+
+class BufferedFileHandler(BufferedStreamHandler):
+    """File handler that batches writes in a 64KB buffer"""
+    
+    def __init__(
+        self,
+        filename: Path,
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 30.0
+    ):
+        super().__init__(open(filename, 'ab', buffering=buffer_size), flush_interval)
+
+
+def _stderr_handler() -> logging.Handler:
+    """
+    Build the stderr handler
+    
+    Terminals keep the line-buffered sys.stderr. Otherwise records are
+    batched in an 8KB buffer on stderr's file descriptor and flushed every
+    second, or immediately for errors.
+    """
+    if _IS_TTY:
+        return logging.StreamHandler(sys.stderr)
+    
+    try:
+        # closefd=False: closing the handler must not close fd 2
+        stream = open(sys.stderr.fileno(), 'wb', buffering=8192, closefd=False)
+    except (AttributeError, OSError, ValueError):
+        # stderr replaced by an object without a real file descriptor
+        return logging.StreamHandler(sys.stderr)
+    
+    return BufferedStreamHandler(stream, flush_interval=1.0)
+
+
+def _queued_file_handler(log_file: Path) -> logging.Handler:
+    """
+    Build a handler that queues records for a background file writer
     
     Args:
-        name: Logger name
+        log_file: Path of the log file to append to
         
     Returns:
-        Configured logger
+        QueueHandler feeding a started QueueListener
     """
-    import os
+    global _file_listener
     
-    # Configure structlog
-    structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.dev.ConsoleRenderer() if sys.stderr.isatty() else structlog.processors.JSONRenderer(),
-        ],
-        context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        cache_logger_on_first_use=True,
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    file_handler = BufferedFileHandler(log_file)
+    
+    _file_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
     )
+    _file_listener.start()
+    # Flush pending records on interpreter shutdown
+    atexit.register(_file_listener.stop)
     
-    # Get log level from environment, default to INFO
-    log_level = getattr(logging, os.environ.get("LOG_LEVEL", "INFO").upper(), logging.INFO)
+    return logging.handlers.QueueHandler(log_queue)
+
+
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def _configure_root_logger(log_level: int) -> None:
+    """
+    Attach stderr (and optional debug file) handlers to the root logger
     
+    Args:
+        log_level: Level to set on the root logger
+    """
     # Configure handlers based on environment
-    handlers = [logging.StreamHandler(sys.stderr)]
+    handlers = [_stderr_handler()]
     
     # Only add file handler in debug mode and if path is specified
-    debug_log_path = os.environ.get("DEBUG_LOG_PATH")
+    debug_log_path = envs.DEBUG_LOG_PATH
     if debug_log_path and log_level == logging.DEBUG:
         try:
             log_file = Path(debug_log_path)
             log_file.parent.mkdir(parents=True, exist_ok=True)
-            handlers.append(logging.FileHandler(log_file, mode='a', encoding='utf-8'))
+            handlers.append(_queued_file_handler(log_file))
         except Exception as e:
             # If file handler fails, just use stderr
             sys.stderr.write(f"Warning: Could not create log file handler: {e}\n")
     
-    # Configure standard logging
-    logging.basicConfig(
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        level=log_level,
-        handlers=handlers
+    # Attach handlers directly. Plain logging.getLogger() records used
+    # across the codebase rely on this format for timestamp, name and level
+    formatter = logging.Formatter(_LOG_FORMAT)
+    root = logging.getLogger()
+    root.setLevel(log_level)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+
+
+def _configure_once() -> None:
+    """Configure structlog and stdlib logging, once per process"""
+    global _configured
+    
+    if _configured:
+        return
+    
+    with _configure_lock:
+        if _configured:
+            return
+        
+        log_level = _LOG_LEVEL
+        
+        # Configure structlog
+        structlog.configure(
+            processors=_processors_for_level(log_level),
+            wrapper_class=structlog.make_filtering_bound_logger(log_level),
+            context_class=dict,
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            cache_logger_on_first_use=True,
+        )
+        
+        # Configure standard logging, unless the root logger already has
+        # handlers (e.g. installed by the host application)
+        if not logging.getLogger().handlers:
+            _configure_root_logger(log_level)
+        
+        _configured = True
+
+
+def set_log_level(level: Union[int, str]) -> None:
+    """
+    Change the log level at runtime
+    
+    Applies to loggers already returned by setup_logger as well as new
+    ones. The debug log file handler is only attached at startup.
+    
+    Args:
+        level: Level number or name such as "DEBUG"
+    """
+    global _LOG_LEVEL
+    
+    if isinstance(level, str):
+        level = getattr(logging, level.upper(), logging.INFO)
+    
+    _LOG_LEVEL = level
+    logging.getLogger().setLevel(level)
+    structlog.configure(
+        processors=_processors_for_level(level),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
     )
     
+    # cache_logger_on_first_use stores each proxy's bound logger as an
+    # instance attribute shadowing bind(); dropping it makes the next call
+    # bind again with the new wrapper class
+    for logger in list(_loggers):
+        logger.__dict__.pop("bind", None)
+
+
+@functools.lru_cache(maxsize=1024)
+def setup_logger(name: Optional[str] = None) -> logging.Logger:
+    """
+    Setup structured logging
+    
+    Global configuration happens on the first call; later calls return a
+    cached logger per name.
+    
+    Args:
+        name: Logger name
+    
+    Returns:
+        Configured logger
+    """
+    _configure_once()
+    
     # Create logger
     if name:
         logger = structlog.get_logger(name)
     else:
         logger = structlog.get_logger()
     
-    return logger
\ No newline at end of file
+    _loggers.add(logger)
+    return logger
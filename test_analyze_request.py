@@ -5,6 +5,7 @@ This simulates what would happen when the MCP tool is called
 """
 
 import asyncio
+import functools
 import json
 import sys
 import os
@@ -17,6 +18,12 @@ from src.utils.config_loader import ConfigLoader
 from src.models.requests import AnalyzeRequest
 
 
+@functools.lru_cache(maxsize=1)
+def load_config():
+    """Load configuration once per process"""
+    return ConfigLoader().load_all()
+
+
 async def test_analyze_request():
     """Test the analyze_request functionality"""
     
@@ -25,8 +32,7 @@ async def test_analyze_request():
     
     try:
         # Load configuration
-        config_loader = ConfigLoader()
-        config = config_loader.load_all()
+        config = load_config()
         
         # Initialize orchestrator without MCP session (external APIs)
         orchestrator = Orchestrator(config, mcp_session=None, metrics=None)
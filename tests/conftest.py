@@ -1,11 +1,21 @@
 """Pytest configuration and fixtures"""
 
 import pytest
+import pytest_asyncio
 import asyncio
+import copy
 import os
+import sys
 from unittest.mock import Mock, AsyncMock
 from typing import Dict, Any
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from src.utils.config_loader import ConfigLoader
+
 
 # Set test environment variables
 os.environ["OPENAI_API_KEY"] = "test-key"
@@ -13,82 +23,142 @@ os.environ["GOOGLE_API_KEY"] = "test-key"
 os.environ["ANTHROPIC_API_KEY"] = "test-key"
 
 
-@pytest.fixture
-def event_loop():
-    """Create an event loop for async tests"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
-@pytest.fixture
-def base_config() -> Dict[str, Any]:
-    """Base configuration for tests"""
-    return {
-        "classification": {
-            "model": "gemini-2.0-flash",
-            "temperature": 0.3,
-            "confidence_threshold": 0.7,
-            "cache_ttl": 300
+# Base configuration shared by test fixtures; never mutate directly
+_BASE_CONFIG: Dict[str, Any] = {
+    "classification": {
+        "model": "gemini-2.0-flash",
+        "temperature": 0.3,
+        "confidence_threshold": 0.7,
+        "cache_ttl": 300
+    },
+    "analysis": {
+        "model": "gemini-2.0-flash",
+        "temperature": 0.3,
+        "cache_ttl": 300
+    },
+    "prompt_generation": {
+        "model": "gpt-4o-mini",
+        "temperature": 0.7,
+        "max_length": 2000,
+        "cache_ttl": 600
+    },
+    "execution": {
+        "simple": {
+            "preferred": "gemini-2.0-flash",
+            "fallback": ["gpt-3.5-turbo", "claude-3-haiku-20240307"]
         },
-        "analysis": {
-            "model": "gemini-2.0-flash",
-            "temperature": 0.3,
-            "cache_ttl": 300
+        "moderate": {
+            "preferred": "gpt-4o-mini",
+            "fallback": ["gemini-2.5-pro", "claude-3-sonnet-20240229"]
         },
-        "prompt_generation": {
-            "model": "gpt-4o-mini",
-            "temperature": 0.7,
-            "max_length": 2000,
-            "cache_ttl": 600
-        },
-        "execution": {
-            "simple": {
-                "preferred": "gemini-2.0-flash",
-                "fallback": ["gpt-3.5-turbo", "claude-3-haiku-20240307"]
-            },
-            "moderate": {
-                "preferred": "gpt-4o-mini",
-                "fallback": ["gemini-2.5-pro", "claude-3-sonnet-20240229"]
-            },
-            "complex": {
-                "preferred": "gpt-4o",
-                "fallback": ["o3", "claude-3-opus-20240229"]
-            }
-        },
-        "mcp_services": {
-            "file_manager": {
-                "type": "stdio",
-                "command": ["node", "/path/to/file-manager.js"],
-                "capabilities": ["read", "write", "search"],
-                "timeout": 30000
-            },
-            "code_analyzer": {
-                "type": "stdio",
-                "command": ["python", "-m", "code_analyzer"],
-                "capabilities": ["analyze", "metrics", "dependencies"],
-                "timeout": 60000
-            },
-            "test_runner": {
-                "type": "http",
-                "url": "http://localhost:8001",
-                "capabilities": ["test", "coverage"],
-                "timeout": 120000
-            }
-        },
-        "cache": {
-            "redis_url": "redis://localhost:6379",
-            "default_ttl": 300
+        "complex": {
+            "preferred": "gpt-4o",
+            "fallback": ["o3", "claude-3-opus-20240229"]
+        }
+    },
+    "mcp_services": {
+        "file_manager": {
+            "type": "stdio",
+            "command": ["node", "/path/to/file-manager.js"],
+            "capabilities": ["read", "write", "search"],
+            "timeout": 30000
         },
-        "metrics": {
-            "prometheus_port": 9090,
-            "collect_interval": 60
+        "code_analyzer": {
+            "type": "stdio",
+            "command": ["python", "-m", "code_analyzer"],
+            "capabilities": ["analyze", "metrics", "dependencies"],
+            "timeout": 60000
         },
-        "logging": {
-            "level": "INFO",
-            "format": "json"
+        "test_runner": {
+            "type": "http",
+            "url": "http://localhost:8001",
+            "capabilities": ["test", "coverage"],
+            "timeout": 120000
         }
+    },
+    "cache": {
+        "redis_url": "redis://localhost:6379",
+        "default_ttl": 300
+    },
+    "metrics": {
+        "prometheus_port": 9090,
+        "collect_interval": 60
+    },
+    "logging": {
+        "level": "INFO",
+        "format": "json"
     }
+}
+
+# Event loop policy, looked up once at import
+_POLICY = asyncio.get_event_loop_policy()
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Event loop policy for async tests (uvloop when available)"""
+    if uvloop is not None and sys.platform != "win32":
+        return uvloop.EventLoopPolicy()
+    return _POLICY
+
+
+@pytest.fixture(scope="session")
+def loaded_config() -> Dict[str, Any]:
+    """Project configuration from config/*.yaml, loaded once per session"""
+    return ConfigLoader().load_all()
+
+
+@pytest.fixture
+def config(loaded_config) -> Dict[str, Any]:
+    """Per-test copy of the project configuration"""
+    return copy.deepcopy(loaded_config)
+
+
+@pytest.fixture(scope="session")
+def metrics_collector():
+    """Metrics collector shared by every orchestrator in the session.
+    
+    Prometheus metrics register in a process-wide registry, so a second
+    MetricsCollector would fail with duplicate timeseries.
+    """
+    from src.monitoring.metrics_collector import MetricsCollector
+    
+    return MetricsCollector({})
+
+
+@pytest_asyncio.fixture(scope="session")
+async def orchestrator_with_cc(loaded_config, metrics_collector):
+    """Orchestrator backed by a mock Claude Code MCP session, initialized once"""
+    from src.orchestrator.coordinator import Orchestrator
+    from tests.mocks import MockMCPSession
+    
+    orchestrator = Orchestrator(
+        copy.deepcopy(loaded_config),
+        mcp_session=MockMCPSession(),
+        metrics=metrics_collector
+    )
+    await orchestrator.initialize()
+    return orchestrator
+
+
+@pytest_asyncio.fixture(scope="session")
+async def orchestrator_without_cc(loaded_config, metrics_collector):
+    """Orchestrator using external APIs only, initialized once"""
+    from src.orchestrator.coordinator import Orchestrator
+    
+    orchestrator = Orchestrator(
+        copy.deepcopy(loaded_config),
+        mcp_session=None,
+        metrics=metrics_collector
+    )
+    await orchestrator.initialize()
+    return orchestrator
+
+
+@pytest.fixture
+def base_config() -> Dict[str, Any]:
+    """Base configuration for tests (private copy, safe to mutate)"""
+    return copy.deepcopy(_BASE_CONFIG)
 
 
 @pytest.fixture
@@ -2,10 +2,81 @@
 
 import pytest
 import asyncio
+import json
 from unittest.mock import Mock, AsyncMock, patch
 
 from src.orchestrator.complexity_analyzer import ComplexityAnalyzer
 
+# Canned LLM responses, serialized once at import
+_SIMPLE_RESPONSE_JSON = json.dumps({
+    "complexity": "simple",
+    "confidence": 0.95,
+    "factors": {
+        "scope": "single_file",
+        "operations": 1,
+        "dependencies": 0,
+        "risk": "low"
+    },
+    "reasoning": "Basic file read operation"
+})
+
+_MODERATE_RESPONSE_JSON = json.dumps({
+    "complexity": "moderate",
+    "confidence": 0.85,
+    "factors": {
+        "scope": "multiple_files",
+        "operations": 5,
+        "dependencies": 2,
+        "risk": "medium"
+    },
+    "reasoning": "Requires analysis across multiple modules"
+})
+
+_COMPLEX_RESPONSE_JSON = json.dumps({
+    "complexity": "complex",
+    "confidence": 0.9,
+    "factors": {
+        "scope": "entire_codebase",
+        "operations": 20,
+        "dependencies": 10,
+        "risk": "high"
+    },
+    "reasoning": "Major refactoring with multiple system impacts"
+})
+
+_NEW_MODULE_RESPONSE_JSON = json.dumps({
+    "complexity": "moderate",
+    "confidence": 0.88,
+    "factors": {
+        "scope": "new_module",
+        "operations": 8,
+        "dependencies": 3,
+        "risk": "medium"
+    }
+})
+
+_CACHED_RESPONSE_JSON = json.dumps({
+    "complexity": "simple",
+    "confidence": 0.92
+})
+
+_FACTORS_RESPONSE_JSON = json.dumps({
+    "complexity": "moderate",
+    "confidence": 0.87,
+    "factors": {
+        "scope": "module",
+        "operations": 6,
+        "dependencies": 4,
+        "risk": "medium",
+        "time_estimate": "2-3 hours",
+        "skills_required": [
+            "Python",
+            "FastAPI",
+            "SQL"
+        ]
+    }
+})
+
 
 class TestComplexityAnalyzer:
     """Test cases for complexity analyzer"""
@@ -29,19 +100,7 @@ class TestComplexityAnalyzer:
     async def test_analyze_simple_complexity(self, analyzer):
         """Test analysis of simple complexity task"""
         with patch.object(analyzer.llm_client, 'complete', new_callable=AsyncMock) as mock_complete:
-            mock_complete.return_value = """
-            {
-                "complexity": "simple",
-                "confidence": 0.95,
-                "factors": {
-                    "scope": "single_file",
-                    "operations": 1,
-                    "dependencies": 0,
-                    "risk": "low"
-                },
-                "reasoning": "Basic file read operation"
-            }
-            """
+            mock_complete.return_value = _SIMPLE_RESPONSE_JSON
             
             result = await analyzer.analyze(
                 "Read the contents of config.json",
@@ -56,19 +115,7 @@ class TestComplexityAnalyzer:
     async def test_analyze_moderate_complexity(self, analyzer):
         """Test analysis of moderate complexity task"""
         with patch.object(analyzer.llm_client, 'complete', new_callable=AsyncMock) as mock_complete:
-            mock_complete.return_value = """
-            {
-                "complexity": "moderate",
-                "confidence": 0.85,
-                "factors": {
-                    "scope": "multiple_files",
-                    "operations": 5,
-                    "dependencies": 2,
-                    "risk": "medium"
-                },
-                "reasoning": "Requires analysis across multiple modules"
-            }
-            """
+            mock_complete.return_value = _MODERATE_RESPONSE_JSON
             
             result = await analyzer.analyze(
                 "Find all API endpoints and their dependencies",
@@ -83,19 +130,7 @@ class TestComplexityAnalyzer:
     async def test_analyze_complex_task(self, analyzer):
         """Test analysis of complex task"""
         with patch.object(analyzer.llm_client, 'complete', new_callable=AsyncMock) as mock_complete:
-            mock_complete.return_value = """
-            {
-                "complexity": "complex",
-                "confidence": 0.90,
-                "factors": {
-                    "scope": "entire_codebase",
-                    "operations": 20,
-                    "dependencies": 10,
-                    "risk": "high"
-                },
-                "reasoning": "Major refactoring with multiple system impacts"
-            }
-            """
+            mock_complete.return_value = _COMPLEX_RESPONSE_JSON
             
             result = await analyzer.analyze(
                 "Refactor the entire authentication system to use OAuth 2.0",
@@ -116,18 +151,7 @@ class TestComplexityAnalyzer:
         }
         
         with patch.object(analyzer.llm_client, 'complete', new_callable=AsyncMock) as mock_complete:
-            mock_complete.return_value = """
-            {
-                "complexity": "moderate",
-                "confidence": 0.88,
-                "factors": {
-                    "scope": "new_module",
-                    "operations": 8,
-                    "dependencies": 3,
-                    "risk": "medium"
-                }
-            }
-            """
+            mock_complete.return_value = _NEW_MODULE_RESPONSE_JSON
             
             result = await analyzer.analyze(
                 "Create a new payment processing module",
@@ -145,12 +169,7 @@ class TestComplexityAnalyzer:
         classification = {"intent": "WRITE"}
         
         with patch.object(analyzer.llm_client, 'complete', new_callable=AsyncMock) as mock_complete:
-            mock_complete.return_value = """
-            {
-                "complexity": "simple",
-                "confidence": 0.92
-            }
-            """
+            mock_complete.return_value = _CACHED_RESPONSE_JSON
             
             # First call
             result1 = await analyzer.analyze(request, classification)
@@ -182,20 +201,7 @@ class TestComplexityAnalyzer:
     async def test_analyze_factors_extraction(self, analyzer):
         """Test extraction of complexity factors"""
         with patch.object(analyzer.llm_client, 'complete', new_callable=AsyncMock) as mock_complete:
-            mock_complete.return_value = """
-            {
-                "complexity": "moderate",
-                "confidence": 0.87,
-                "factors": {
-                    "scope": "module",
-                    "operations": 6,
-                    "dependencies": 4,
-                    "risk": "medium",
-                    "time_estimate": "2-3 hours",
-                    "skills_required": ["Python", "FastAPI", "SQL"]
-                }
-            }
-            """
+            mock_complete.return_value = _FACTORS_RESPONSE_JSON
             
             result = await analyzer.analyze(
                 "Add caching to the database queries",
@@ -0,0 +1,106 @@
+"""Tests for configuration loader"""
+
+import os
+
+import pytest
+
+from src.utils.config_loader import ConfigLoader
+
+
+class TestConfigLoader:
+    """Test cases for configuration loader"""
+    
+    @pytest.fixture
+    def config_dir(self, tmp_path):
+        """Config directory with a single models.yaml"""
+        (tmp_path / "models.yaml").write_text("classifier:\n  default: gemini-2.0-flash\n")
+        return tmp_path
+    
+    @pytest.fixture
+    def loader(self, config_dir):
+        """Loader reading from the temporary config directory"""
+        return ConfigLoader(str(config_dir))
+    
+    def test_get_dotted_key(self, loader):
+        """Test that get() resolves dotted keys against the merged config"""
+        assert loader.get("models.classifier.default") == "gemini-2.0-flash"
+        assert loader.get("models.classifier.missing", "fallback") == "fallback"
+        assert loader.get("env.LOG_LEVEL") is not None
+    
+    def test_get_sees_file_edits(self, loader, config_dir):
+        """Test that get() returns the new value after the file is edited"""
+        assert loader.get("models.classifier.default") == "gemini-2.0-flash"
+        
+        (config_dir / "models.yaml").write_text("classifier:\n  default: gpt-4o-mini-2024\n")
+        
+        assert loader.get("models.classifier.default") == "gpt-4o-mini-2024"
+    
+    def test_get_sees_new_files(self, loader, config_dir):
+        """Test that get() picks up config files added after the first call"""
+        assert loader.get("agents.timeout") is None
+        
+        (config_dir / "agents.yaml").write_text("timeout: 30\n")
+        
+        assert loader.get("agents.timeout") == 30
+    
+    def test_load_yaml_reuses_unchanged_file(self, loader):
+        """Test that an unchanged file is served from the cache"""
+        first = loader.load_yaml("models.yaml")
+        
+        assert loader.load_yaml("models.yaml") is first
+    
+    def test_load_yaml_reparses_on_mtime_change(self, loader, config_dir):
+        """Test that a same-size rewrite is re-parsed once its mtime changes"""
+        path = config_dir / "models.yaml"
+        first = loader.load_yaml("models.yaml")
+        st = path.stat()
+        
+        path.write_text("classifier:\n  default: gemini-2.0-flosh\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        
+        second = loader.load_yaml("models.yaml")
+        assert path.stat().st_size == st.st_size
+        assert second is not first
+        assert second["classifier"]["default"] == "gemini-2.0-flosh"
+    
+    def test_load_yaml_reparses_on_size_change(self, loader, config_dir):
+        """Test that a rewrite with an unchanged mtime is re-parsed once its size changes"""
+        path = config_dir / "models.yaml"
+        first = loader.load_yaml("models.yaml")
+        st = path.stat()
+        
+        path.write_text("classifier:\n  default: gemini-2.5-pro\n  fallback: gpt-4o\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        second = loader.load_yaml("models.yaml")
+        assert path.stat().st_mtime_ns == st.st_mtime_ns
+        assert second is not first
+        assert second["classifier"] == {"default": "gemini-2.5-pro", "fallback": "gpt-4o"}
+    
+    def test_env_var_embedded_mid_string(self, loader, config_dir, monkeypatch):
+        """Test that ${VAR} placeholders are substituted anywhere in a string"""
+        monkeypatch.setenv("DS_TEST_HOST", "db.internal")
+        monkeypatch.setenv("DS_TEST_PORT", "5432")
+        (config_dir / "services.yaml").write_text(
+            "url: postgres://${DS_TEST_HOST}:${DS_TEST_PORT}/app\n"
+            "hosts:\n  - primary-${DS_TEST_HOST}\n"
+        )
+        
+        config = loader.load_yaml("services.yaml")
+        
+        assert config["url"] == "postgres://db.internal:5432/app"
+        assert config["hosts"] == ["primary-db.internal"]
+    
+    def test_unset_env_var_left_verbatim(self, loader, config_dir, monkeypatch):
+        """Test that placeholders for unset variables are kept as written"""
+        monkeypatch.setenv("DS_TEST_HOST", "db.internal")
+        monkeypatch.delenv("DS_TEST_UNSET", raising=False)
+        (config_dir / "services.yaml").write_text(
+            "key: ${DS_TEST_UNSET}\n"
+            "url: https://${DS_TEST_HOST}/${DS_TEST_UNSET}/v1\n"
+        )
+        
+        config = loader.load_yaml("services.yaml")
+        
+        assert config["key"] == "${DS_TEST_UNSET}"
+        assert config["url"] == "https://db.internal/${DS_TEST_UNSET}/v1"
@@ -35,6 +35,26 @@ class TestOrchestrateRequest:
         with pytest.raises(ValueError, match="Request too long"):
             OrchestrateRequest(request="x" * 10001)
     
+    def test_bytes_request_decoded(self):
+        """Test that a UTF-8 bytes request is decoded and validated as text"""
+        validated = OrchestrateRequest(request="  Show me caf\u00e9.py  ".encode("utf-8"))
+        assert validated.request == "Show me caf\u00e9.py"
+        
+        # 10000 three-byte characters fit: the limit is on decoded length
+        validated = OrchestrateRequest(request=("\u20ac" * 10000).encode("utf-8"))
+        assert len(validated.request) == 10000
+    
+    def test_bytes_request_too_long(self):
+        """Test that oversize bytes requests are rejected"""
+        # Decodes to 10001 characters
+        with pytest.raises(ValueError, match="Request too long"):
+            OrchestrateRequest(request=b"x" * 10001)
+        
+        # Past 4 bytes per character the input is rejected before decoding,
+        # so invalid UTF-8 reports the length rather than a decode error
+        with pytest.raises(ValueError, match="Request too long"):
+            OrchestrateRequest(request=b"\xff" * 40001)
+    
     def test_sql_injection_attempt(self):
         """Test that SQL injection patterns are rejected"""
         with pytest.raises(ValueError, match="Invalid pattern"):
@@ -58,6 +78,18 @@ class TestOrchestrateRequest:
             with pytest.raises(ValueError, match="Invalid pattern"):
                 OrchestrateRequest(request=req)
     
+    def test_non_ascii_case_variant_injection_attempt(self):
+        """Test that injection patterns spelled with non-ASCII case variants are rejected"""
+        dangerous_requests = [
+            "__\u0131mport__('os')",
+            "__\u0130mport__('os')",
+            "javascr\u0131pt:x"
+        ]
+        
+        for req in dangerous_requests:
+            with pytest.raises(ValueError, match="Invalid pattern"):
+                OrchestrateRequest(request=req)
+    
     def test_context_too_large(self):
         """Test that overly large context is rejected"""
         large_context = {"data": "x" * 60000}
@@ -65,6 +97,26 @@ class TestOrchestrateRequest:
         with pytest.raises(ValueError, match="Context too large"):
             OrchestrateRequest(request="Test", context=large_context)
     
+    def test_context_size_boundary(self):
+        """Test that the context limit applies to its str() length, 50000 characters"""
+        # "{'data': '" + payload + "'}" adds 12 characters
+        at_limit = {"data": "x" * 49988}
+        assert len(str(at_limit)) == 50000
+        OrchestrateRequest(request="Test", context=at_limit)
+        
+        with pytest.raises(ValueError, match="Context too large"):
+            OrchestrateRequest(request="Test", context={"data": "x" * 49989})
+    
+    def test_context_with_many_numbers(self):
+        """Test that numbers count by their printed length, not a flat size"""
+        # About 30000 characters when printed
+        numbers = {"a": [1] * 10000}
+        OrchestrateRequest(request="Test", context=numbers)
+        
+        # 20000 five-digit numbers print to about 140000 characters
+        with pytest.raises(ValueError, match="Context too large"):
+            OrchestrateRequest(request="Test", context={"a": [10000] * 20000})
+    
     def test_invalid_max_cost(self):
         """Test max_cost validation"""
         # Negative cost
@@ -4,13 +4,13 @@ import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch
 
-from src.orchestrator.intent_classifier import IntentClassifier, Intent
+from src.orchestrator.intent_classifier import IntentClassifier, Intent, _parse_json_reply
 
 
 class TestIntentClassifier:
     """Test cases for intent classifier"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def config(self):
         """Test configuration"""
         return {
@@ -21,11 +21,16 @@ class TestIntentClassifier:
             }
         }
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def classifier(self, config):
-        """Create test classifier instance"""
+        """Create test classifier instance, shared across tests"""
         return IntentClassifier(config)
     
+    @pytest.fixture(autouse=True)
+    def clear_classification_cache(self, classifier):
+        """Start each test with an empty classification cache"""
+        classifier._cache.clear()
+    
     @pytest.mark.asyncio
     async def test_classify_read_intent(self, classifier):
         """Test classification of READ intent"""
@@ -160,6 +165,74 @@ class TestIntentClassifier:
             # Should handle gracefully
             assert result["intent"] == Intent.ANALYZE
             assert result["confidence"] == 0.5
+    
+    @pytest.mark.asyncio
+    async def test_classify_json_reply_with_prose(self, classifier):
+        """Test that a JSON reply wrapped in prose uses its intent and confidence"""
+        with patch.object(classifier.llm_client, 'complete', new_callable=AsyncMock) as mock_complete:
+            mock_complete.return_value = (
+                'Sure, here is the classification:\n'
+                '{"intent": "SEARCH", "confidence": 0.82, "reasoning": "Looking for files"}\n'
+                'Let me know if you need anything else.'
+            )
+            
+            result = await classifier.classify("Find all TODO comments")
+            
+            assert result["intent"] == Intent.SEARCH.value
+            assert result["confidence"] == 0.82
+            assert result["reasoning"] == "Looking for files"
+    
+    @pytest.mark.asyncio
+    async def test_classify_malformed_json_reply(self, classifier):
+        """Test that malformed JSON falls back to reading the reply as text"""
+        with patch.object(classifier.llm_client, 'complete', new_callable=AsyncMock) as mock_complete:
+            mock_complete.return_value = '{"intent": "write", "confidence": }'
+            
+            result = await classifier.classify("Create a config file")
+            
+            assert result["intent"] == Intent.WRITE.value
+            assert result["confidence"] != 0.0
+            assert "reasoning" not in result
+    
+    @pytest.mark.asyncio
+    async def test_classify_out_of_range_confidence(self, classifier):
+        """Test that reported confidences outside [0, 1] are recalculated"""
+        with patch.object(classifier.llm_client, 'complete', new_callable=AsyncMock) as mock_complete:
+            for i, reported in enumerate(["7", "-0.5", "true"]):
+                mock_complete.return_value = f'{{"intent": "read", "confidence": {reported}}}'
+                
+                result = await classifier.classify(f"Show me file {i}")
+                
+                # An exact answer scores 1.0 from _calculate_confidence
+                assert result["intent"] == Intent.READ.value
+                assert result["confidence"] == 1.0
+
+
+class TestParseJsonReply:
+    """Test cases for extracting JSON objects from classifier replies"""
+    
+    def test_bare_object(self):
+        """Test a reply that is only a JSON object"""
+        assert _parse_json_reply('{"intent": "read"}') == {"intent": "read"}
+    
+    def test_object_with_surrounding_prose(self):
+        """Test that prose before and after the object is ignored"""
+        reply = 'Classification:\n```json\n{"intent": "manage", "confidence": 0.7}\n```\nDone.'
+        assert _parse_json_reply(reply) == {"intent": "manage", "confidence": 0.7}
+    
+    def test_malformed_json(self):
+        """Test that malformed payloads yield None instead of raising"""
+        assert _parse_json_reply('{"intent": "read", "confidence": }') is None
+        assert _parse_json_reply('{"intent": "read"') is None
+        assert _parse_json_reply('} read {') is None
+        # Two objects slice into one invalid payload
+        assert _parse_json_reply('{"intent": "read"} or {"intent": "write"}') is None
+    
+    def test_no_object(self):
+        """Test replies without a JSON object"""
+        assert _parse_json_reply("read") is None
+        assert _parse_json_reply("") is None
+        assert _parse_json_reply('["read"]') is None
 
 
 if __name__ == "__main__":
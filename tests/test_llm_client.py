@@ -0,0 +1,109 @@
+"""Tests for the unified LLM client"""
+
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+import yaml
+
+from src.utils import llm_client as llm_module
+from src.utils.llm_client import LLMClient, LLMProvider
+
+
+def _configured_model_names():
+    """Collect every model name referenced in config/models.yaml"""
+    path = Path(__file__).resolve().parent.parent / "config" / "models.yaml"
+    with open(path) as f:
+        models = yaml.safe_load(f)["models"]
+    
+    names = set()
+    stack = [models]
+    while stack:
+        node = stack.pop()
+        for key, value in node.items():
+            if isinstance(value, dict):
+                stack.append(value)
+            elif key in ("default", "preferred"):
+                names.add(value)
+            elif key in ("alternatives", "fallback"):
+                names.update(value)
+    return sorted(names)
+
+
+class TestLLMClient:
+    """Test cases for LLM client provider setup"""
+    
+    @pytest.fixture
+    def sdk_factory_calls(self, monkeypatch):
+        """Replace the provider SDK factories with recorders of the providers built"""
+        calls = []
+        for provider, (name, _) in list(llm_module._SDK_FACTORIES.items()):
+            def factory(api_key, provider=provider):
+                calls.append(provider)
+                return object()
+            monkeypatch.setitem(llm_module._SDK_FACTORIES, provider, (name, factory))
+        return calls
+    
+    @pytest_asyncio.fixture
+    async def client(self, sdk_factory_calls):
+        """Initialized client with API keys for every provider and no Claude Code"""
+        client = LLMClient({"use_claude_code": False})
+        await client.initialize()
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_sdk_imported_on_first_use(self, client, sdk_factory_calls):
+        """Test that a provider SDK is only imported when the provider is first used"""
+        assert sdk_factory_calls == []
+        
+        openai_client = client._get_client(LLMProvider.OPENAI)
+        assert sdk_factory_calls == [LLMProvider.OPENAI]
+        
+        # Later calls reuse the client
+        assert client._get_client(LLMProvider.OPENAI) is openai_client
+        assert sdk_factory_calls == [LLMProvider.OPENAI]
+    
+    @pytest.mark.asyncio
+    async def test_configured_providers_before_first_use(self, client):
+        """Test that configured providers include keyed providers whose SDK isn't loaded yet"""
+        expected = [LLMProvider.OPENAI, LLMProvider.GOOGLE, LLMProvider.ANTHROPIC]
+        
+        assert client.clients == {}
+        assert client.configured_providers == expected
+        
+        client._get_client(LLMProvider.GOOGLE)
+        assert client.configured_providers == expected
+    
+    @pytest.mark.asyncio
+    async def test_complete_resolves_mixed_case_gemini_name(self, client, monkeypatch):
+        """Test that complete() routes a mixed-case Gemini name and maps it once lowered"""
+        requested = []
+        
+        class _Response:
+            text = "ok"
+        
+        class _Model:
+            def __init__(self, name):
+                requested.append(name)
+            
+            async def generate_content_async(self, prompt, generation_config):
+                return _Response()
+        
+        genai = type("genai", (), {"GenerativeModel": _Model})
+        monkeypatch.setitem(client.clients, LLMProvider.GOOGLE, genai)
+        
+        assert await client.complete("hi", model="Gemini-2.5-PRO") == "ok"
+        assert await client.complete("hi", model="GEMINI-2.0-Flash") == "ok"
+        assert requested == ["gemini-1.5-pro", "gemini-2.0-flash-exp"]
+    
+    @pytest.mark.parametrize("model", _configured_model_names())
+    def test_provider_for_configured_models(self, model):
+        """Test that every model in config/models.yaml routes to its vendor"""
+        vendors = {
+            "gpt": LLMProvider.OPENAI,
+            "gemini": LLMProvider.GOOGLE,
+            "claude": LLMProvider.ANTHROPIC,
+        }
+        expected = vendors[model.split("-", 1)[0]]
+        
+        assert llm_module._provider_for_model(model.lower()) == expected
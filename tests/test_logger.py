@@ -0,0 +1,70 @@
+"""Tests for logging configuration"""
+
+import logging
+
+import pytest
+
+from src.utils import logger as logger_module
+from src.utils.logger import set_log_level, setup_logger
+
+
+def _messages(caplog, name):
+    """Rendered messages recorded for one logger name"""
+    return [record.getMessage() for record in caplog.records if record.name == name]
+
+
+class TestSetLogLevel:
+    """Test cases for changing the log level at runtime"""
+    
+    @pytest.fixture(autouse=True)
+    def restore_log_level(self):
+        """Put the original level back after each test"""
+        original = logger_module._LOG_LEVEL
+        yield
+        set_log_level(original)
+    
+    def test_raise_verbosity_for_existing_logger(self, caplog):
+        """Test that a logger bound before the change starts emitting debug records"""
+        set_log_level("INFO")
+        log = setup_logger("tests.level_probe")
+        log.debug("probe-before")  # binds and caches the INFO-level logger
+        
+        set_log_level("DEBUG")
+        log.debug("probe-after")
+        setup_logger("tests.level_probe").debug("probe-again")
+        
+        messages = " ".join(_messages(caplog, "tests.level_probe"))
+        assert "probe-before" not in messages
+        assert "probe-after" in messages
+        assert "probe-again" in messages
+    
+    def test_lower_verbosity_for_existing_logger(self, caplog):
+        """Test that a logger bound at DEBUG stops emitting below the new level"""
+        set_log_level(logging.DEBUG)
+        log = setup_logger("tests.quiet_probe")
+        log.info("quiet-before")
+        
+        set_log_level("WARNING")
+        log.info("quiet-after")
+        log.warning("quiet-warning")
+        
+        messages = " ".join(_messages(caplog, "tests.quiet_probe"))
+        assert "quiet-before" in messages
+        assert "quiet-after" not in messages
+        assert "quiet-warning" in messages
+
+
+class TestProcessorChain:
+    """Test cases for the structlog processor chain"""
+    
+    def test_bytes_values_rendered_as_text(self):
+        """Test that bytes event values reach the orjson serializer decoded"""
+        pytest.importorskip("orjson")
+        
+        event_dict = {"event": "probe", "payload": "café".encode("utf-8")}
+        for processor in logger_module._PROCESSORS[:-1]:
+            event_dict = processor(logging.getLogger("tests.chain"), "info", event_dict)
+        
+        rendered = logger_module._orjson_dumps(event_dict)
+        assert '"payload":"café"' in rendered
+
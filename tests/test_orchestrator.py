@@ -1,16 +1,125 @@
 """Integration tests for the main orchestrator"""
 
 import pytest
+import pytest_asyncio
 import asyncio
+import copy
+from types import MappingProxyType
+from typing import Mapping
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 
-from src.orchestrator.coordinator import Coordinator
+from src.orchestrator.coordinator import Orchestrator
+
+
+def _areturn(value):
+    """Plain coroutine stub returning value, for patches that are never inspected
+    
+    Mappings come back as a fresh dict on every call, the type the real
+    components return, so the coordinator never sees a read-only view.
+    """
+    async def _stub(*args, **kwargs):
+        if isinstance(value, Mapping):
+            return copy.deepcopy(dict(value))
+        return value
+    return _stub
+
+
+# Canned component responses, shared read-only across tests; hand the
+# coordinator a dict copy, never the view itself
+_READ_CLASSIFY = MappingProxyType({
+    "intent": "read",
+    "confidence": 0.95
+})
+
+_MANAGE_CLASSIFY = MappingProxyType({
+    "intent": "manage",
+    "confidence": 0.88
+})
+
+# ComplexityAnalyzer.analyze returns the bare complexity level
+_SIMPLE_ANALYSIS = "simple"
+
+_COMPLEX_ANALYSIS = "complex"
+
+# Replies for the component LLM clients, so no test reaches a provider API
+_LLM_REPLIES = MappingProxyType({
+    "intent_classifier": "write",
+    "complexity_analyzer": "moderate",
+    "prompt_generator": "You are a helpful assistant.",
+    "fallback_handler": "Done",
+})
+
+_READ_EXECUTION = MappingProxyType({
+    "success": True,
+    "response": "File contents: print('Hello, World!')",
+    "model_used": "gemini-2.0-flash",
+    "services_used": ["file_manager"],
+    "tokens_used": 50,
+    "tokens_saved": 100,
+    "cost": 0.001,
+    "duration_ms": 500
+})
+
+_REFACTOR_EXECUTION = MappingProxyType({
+    "success": True,
+    "response": "Refactoring plan: 1. Extract interfaces...",
+    "model_used": "gpt-4o",
+    "services_used": ["file_manager", "code_analyzer"],
+    "tokens_used": 2000,
+    "tokens_saved": 4000,
+    "cost": 0.05,
+    "duration_ms": 3000
+})
+
+_ENDPOINT_EXECUTION = MappingProxyType({
+    "success": True,
+    "response": "Created new endpoint",
+    "model_used": "gpt-4o-mini",
+    "services_used": ["file_manager"],
+    "tokens_used": 100,
+    "cost": 0.002
+})
+
+_ANALYSIS_EXECUTION = MappingProxyType({
+    "success": True,
+    "response": "Analysis complete",
+    "model_used": "gemini-2.5-pro",
+    "services_used": [],
+    "tokens_used": 200,
+    "cost": 0.008
+})
+
+_FALLBACK_EXECUTION = MappingProxyType({
+    "success": True,
+    "response": "Completed with fallback",
+    "model_used": "gpt-3.5-turbo",  # Fallback model
+    "services_used": [],
+    "tokens_used": 150,
+    "cost": 0.003,
+    "fallback_attempts": 2,
+    "attempts": [
+        {"model": "gpt-4o", "success": False, "error": "Rate limit"},
+        {"model": "gemini-2.5-pro", "success": False, "error": "API error"},
+        {"model": "gpt-3.5-turbo", "success": True}
+    ]
+})
+
+_UPDATE_EXECUTION = MappingProxyType({
+    "success": True,
+    "response": "Done",
+    "model_used": "gpt-4o-mini",
+    "services_used": ["file_manager"],
+    "tokens_used": 100,
+    "tokens_saved": 200,
+    "cost": 0.002,
+    "duration_ms": 1000
+})
 
 
 class TestOrchestrator:
     """Integration tests for the coordinator"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def config(self):
         """Test configuration"""
         return {
@@ -49,112 +158,61 @@ class TestOrchestrator:
             }
         }
     
-    @pytest.fixture
-    async def coordinator(self, config):
-        """Create test coordinator instance"""
-        coord = Coordinator(config)
+    @pytest_asyncio.fixture(scope="session")
+    async def coordinator(self, config, metrics_collector):
+        """Create test coordinator instance, initialized once per session"""
+        coord = Orchestrator(config, metrics=metrics_collector)
         await coord.initialize()
         return coord
     
+    @pytest.fixture(autouse=True)
+    def offline_llm_clients(self, coordinator, mocker):
+        """Stub every component's LLM client and start with an empty classification cache"""
+        for component, reply in _LLM_REPLIES.items():
+            llm_client = getattr(coordinator, component).llm_client
+            mocker.patch.object(llm_client, 'complete', new=_areturn(reply))
+        coordinator.intent_classifier._cache.clear()
+    
     @pytest.mark.asyncio
-    async def test_orchestrate_simple_read(self, coordinator):
+    async def test_orchestrate_simple_read(self, coordinator, mocker):
         """Test orchestration of a simple read request"""
-        # Mock the components
-        with patch.object(coordinator.intent_classifier, 'classify', new_callable=AsyncMock) as mock_classify, \
-             patch.object(coordinator.complexity_analyzer, 'analyze', new_callable=AsyncMock) as mock_analyze, \
-             patch.object(coordinator.service_selector, 'select_services', new_callable=AsyncMock) as mock_select_services, \
-             patch.object(coordinator.prompt_generator, 'generate', new_callable=AsyncMock) as mock_generate, \
-             patch.object(coordinator.model_selector, 'select_model', new_callable=AsyncMock) as mock_select_model, \
-             patch.object(coordinator.fallback_handler, 'execute_with_fallback', new_callable=AsyncMock) as mock_execute:
-            
-            # Setup mock returns
-            mock_classify.return_value = {
-                "intent": "READ",
-                "confidence": 0.95
-            }
-            
-            mock_analyze.return_value = {
-                "complexity": "simple",
-                "confidence": 0.90
-            }
-            
-            mock_select_services.return_value = ["file_manager"]
-            
-            mock_generate.return_value = "You are a helpful assistant. Read the requested file."
-            
-            mock_select_model.return_value = "gemini-2.0-flash"
-            
-            mock_execute.return_value = {
-                "success": True,
-                "response": "File contents: print('Hello, World!')",
-                "model_used": "gemini-2.0-flash",
-                "services_used": ["file_manager"],
-                "tokens_used": 50,
-                "tokens_saved": 100,
-                "cost": 0.001,
-                "duration_ms": 500
-            }
-            
-            # Execute orchestration
-            result = await coordinator.orchestrate("Show me the contents of main.py")
-            
-            # Verify the flow
-            assert result["success"] == True
-            assert result["intent"] == "READ"
-            assert result["complexity"] == "simple"
-            assert result["selected_model"] == "gemini-2.0-flash"
-            assert result["selected_services"] == ["file_manager"]
-            assert "response" in result
-            assert "metrics" in result
+        # Mock the components; mocker undoes all patches after the test
+        mocker.patch.object(coordinator.intent_classifier, 'classify', new=_areturn(_READ_CLASSIFY))
+        mocker.patch.object(coordinator.complexity_analyzer, 'analyze', new=_areturn(_SIMPLE_ANALYSIS))
+        mocker.patch.object(coordinator.service_selector, 'select_services', new=_areturn(["file_manager"]))
+        mocker.patch.object(coordinator.prompt_generator, 'generate', new=_areturn("You are a helpful assistant. Read the requested file."))
+        mocker.patch.object(coordinator.model_selector, 'select_model', new=_areturn("gemini-2.0-flash"))
+        mocker.patch.object(coordinator.fallback_handler, 'execute_with_fallback', new=_areturn(_READ_EXECUTION))
+        
+        # Execute orchestration
+        result = await coordinator.orchestrate("Show me the contents of main.py")
+        
+        # Verify the flow
+        assert result["success"] == True
+        assert result["intent"] == "read"
+        assert result["complexity"] == "simple"
+        assert result["selected_model"] == "gemini-2.0-flash"
+        assert result["selected_services"] == ["file_manager"]
+        assert "response" in result
+        assert "metrics" in result
     
     @pytest.mark.asyncio
-    async def test_orchestrate_complex_refactor(self, coordinator):
+    async def test_orchestrate_complex_refactor(self, coordinator, mocker):
         """Test orchestration of a complex refactoring request"""
-        with patch.object(coordinator.intent_classifier, 'classify', new_callable=AsyncMock) as mock_classify, \
-             patch.object(coordinator.complexity_analyzer, 'analyze', new_callable=AsyncMock) as mock_analyze, \
-             patch.object(coordinator.service_selector, 'select_services', new_callable=AsyncMock) as mock_select_services, \
-             patch.object(coordinator.prompt_generator, 'generate', new_callable=AsyncMock) as mock_generate, \
-             patch.object(coordinator.model_selector, 'select_model', new_callable=AsyncMock) as mock_select_model, \
-             patch.object(coordinator.fallback_handler, 'execute_with_fallback', new_callable=AsyncMock) as mock_execute:
-            
-            mock_classify.return_value = {
-                "intent": "MANAGE",
-                "confidence": 0.88
-            }
-            
-            mock_analyze.return_value = {
-                "complexity": "complex",
-                "confidence": 0.85,
-                "factors": {
-                    "scope": "entire_codebase",
-                    "risk": "high"
-                }
-            }
-            
-            mock_select_services.return_value = ["file_manager", "code_analyzer", "test_runner"]
-            
-            mock_generate.return_value = "You are an expert software architect..."
-            
-            mock_select_model.return_value = "gpt-4o"
-            
-            mock_execute.return_value = {
-                "success": True,
-                "response": "Refactoring plan: 1. Extract interfaces...",
-                "model_used": "gpt-4o",
-                "services_used": ["file_manager", "code_analyzer"],
-                "tokens_used": 2000,
-                "tokens_saved": 4000,
-                "cost": 0.05,
-                "duration_ms": 3000
-            }
-            
-            result = await coordinator.orchestrate(
-                "Refactor the authentication module to use dependency injection"
-            )
-            
-            assert result["complexity"] == "complex"
-            assert result["selected_model"] == "gpt-4o"
-            assert len(result["selected_services"]) == 3
+        mocker.patch.object(coordinator.intent_classifier, 'classify', new=_areturn(_MANAGE_CLASSIFY))
+        mocker.patch.object(coordinator.complexity_analyzer, 'analyze', new=_areturn(_COMPLEX_ANALYSIS))
+        mocker.patch.object(coordinator.service_selector, 'select_services', new=_areturn(["file_manager", "code_analyzer", "test_runner"]))
+        mocker.patch.object(coordinator.prompt_generator, 'generate', new=_areturn("You are an expert software architect..."))
+        mocker.patch.object(coordinator.model_selector, 'select_model', new=_areturn("gpt-4o"))
+        mocker.patch.object(coordinator.fallback_handler, 'execute_with_fallback', new=_areturn(_REFACTOR_EXECUTION))
+        
+        result = await coordinator.orchestrate(
+            "Refactor the authentication module to use dependency injection"
+        )
+        
+        assert result["complexity"] == "complex"
+        assert result["selected_model"] == "gpt-4o"
+        assert len(result["selected_services"]) == 3
     
     @pytest.mark.asyncio
     async def test_orchestrate_with_context(self, coordinator):
@@ -166,14 +224,7 @@ class TestOrchestrator:
         }
         
         with patch.object(coordinator.fallback_handler, 'execute_with_fallback', new_callable=AsyncMock) as mock_execute:
-            mock_execute.return_value = {
-                "success": True,
-                "response": "Created new endpoint",
-                "model_used": "gpt-4o-mini",
-                "services_used": ["file_manager"],
-                "tokens_used": 100,
-                "cost": 0.002
-            }
+            mock_execute.return_value = dict(_ENDPOINT_EXECUTION)
             
             result = await coordinator.orchestrate(
                 "Add a new endpoint for user profiles",
@@ -183,6 +234,10 @@ class TestOrchestrator:
             # Verify context was passed through
             call_args = mock_execute.call_args
             assert call_args[1]["context"] == context
+            
+            # Verify the canned execution result reached the response
+            assert result["response"] == "Created new endpoint"
+            assert result["metrics"]["cost_usd"] == 0.002
     
     @pytest.mark.asyncio
     async def test_orchestrate_with_options(self, coordinator):
@@ -194,81 +249,48 @@ class TestOrchestrator:
         }
         
         with patch.object(coordinator.model_selector, 'select_model', new_callable=AsyncMock) as mock_select_model, \
-             patch.object(coordinator.fallback_handler, 'execute_with_fallback', new_callable=AsyncMock) as mock_execute:
+             patch.object(coordinator.fallback_handler, 'execute_with_fallback', new=_areturn(_ANALYSIS_EXECUTION)):
             
             mock_select_model.return_value = "gemini-2.5-pro"
             
-            mock_execute.return_value = {
-                "success": True,
-                "response": "Analysis complete",
-                "model_used": "gemini-2.5-pro",
-                "services_used": [],
-                "tokens_used": 200,
-                "cost": 0.008
-            }
-            
             result = await coordinator.orchestrate(
                 "Analyze code quality",
                 options=options
             )
             
             # Verify options were considered
-            mock_select_model.assert_called_with("moderate", options)
+            mock_select_model.assert_called_with(complexity="moderate", options=options)
             assert result["selected_model"] == "gemini-2.5-pro"
     
     @pytest.mark.asyncio
     async def test_orchestrate_fallback_on_failure(self, coordinator):
         """Test that orchestration handles failures with fallback"""
-        with patch.object(coordinator.fallback_handler, 'execute_with_fallback', new_callable=AsyncMock) as mock_execute:
-            mock_execute.return_value = {
-                "success": True,
-                "response": "Completed with fallback",
-                "model_used": "gpt-3.5-turbo",  # Fallback model
-                "services_used": [],
-                "tokens_used": 150,
-                "cost": 0.003,
-                "fallback_attempts": 2,
-                "attempts": [
-                    {"model": "gpt-4o", "success": False, "error": "Rate limit"},
-                    {"model": "gemini-2.5-pro", "success": False, "error": "API error"},
-                    {"model": "gpt-3.5-turbo", "success": True}
-                ]
-            }
-            
-            result = await coordinator.orchestrate("Generate unit tests")
+        with patch.object(coordinator.fallback_handler, 'execute_with_fallback', new=_areturn(_FALLBACK_EXECUTION)):
+            result = await coordinator.orchestrate("Generate unit tests", options={"verbose": True})
             
             assert result["success"] == True
-            assert "fallback_attempts" in result.get("metrics", {})
+            assert result["selected_model"] == "gpt-3.5-turbo"
+            assert result["debug"]["fallback_attempts"] == 2
     
     @pytest.mark.asyncio
     async def test_orchestrate_metrics_tracking(self, coordinator):
         """Test that metrics are properly tracked"""
-        with patch.object(coordinator.metrics_collector, 'start_request') as mock_start, \
-             patch.object(coordinator.metrics_collector, 'end_request', new_callable=AsyncMock) as mock_end, \
-             patch.object(coordinator.fallback_handler, 'execute_with_fallback', new_callable=AsyncMock) as mock_execute:
+        with patch.object(coordinator.metrics, 'start_request') as mock_start, \
+             patch.object(coordinator.metrics, 'record_orchestration', new_callable=AsyncMock) as mock_record, \
+             patch.object(coordinator.fallback_handler, 'execute_with_fallback', new=_areturn(_UPDATE_EXECUTION)):
             
             mock_start.return_value = "req_123"
             
-            mock_execute.return_value = {
-                "success": True,
-                "response": "Done",
-                "model_used": "gpt-4o-mini",
-                "services_used": ["file_manager"],
-                "tokens_used": 100,
-                "tokens_saved": 200,
-                "cost": 0.002,
-                "duration_ms": 1000
-            }
-            
             result = await coordinator.orchestrate("Update configuration")
             
             # Verify metrics were tracked
             mock_start.assert_called_once()
-            mock_end.assert_called_once()
+            mock_record.assert_called_once()
             
-            # Check that request_id was passed to end_request
-            end_call_args = mock_end.call_args
-            assert end_call_args[0][0] == "req_123"
+            # Check that request_id was passed to record_orchestration
+            record_call_args = mock_record.call_args
+            assert record_call_args[1]["request_id"] == "req_123"
+            assert record_call_args[1]["tokens_used"] == 100
     
     @pytest.mark.asyncio
     async def test_orchestrate_error_handling(self, coordinator):
@@ -281,6 +303,20 @@ class TestOrchestrator:
             assert result["success"] == False
             assert "error" in result
             assert "Classification failed" in result["error"]
+    
+    def test_component_patches_are_undone(self, coordinator):
+        """Test that mocker patches on the shared coordinator end with each test"""
+        patched = [
+            (coordinator.intent_classifier, 'classify'),
+            (coordinator.complexity_analyzer, 'analyze'),
+            (coordinator.service_selector, 'select_services'),
+            (coordinator.prompt_generator, 'generate'),
+            (coordinator.model_selector, 'select_model'),
+            (coordinator.fallback_handler, 'execute_with_fallback'),
+        ]
+        
+        for component, name in patched:
+            assert name not in vars(component), f"{type(component).__name__}.{name} is still patched"
 
 
 if __name__ == "__main__":